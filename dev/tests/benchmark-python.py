@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+"""
+benchmark-python.py - Benchmarks for the Python tooling hot paths
+
+Times the parsing and ingest, statistics, templating and interim
+result parsing and post-processing code of dev/tools and doc/examples on synthetic netperf output, records
+the peak memory of each stage, and compares the results against a stored
+baseline.
+
+Usage:
+  benchmark-python.py                             # 10^3..10^5 rows, compare to baseline
+  benchmark-python.py --sizes 1e6 --stage ingest  # larger scales
+  benchmark-python.py --stage parse.csv stats     # selected stages (prefix match)
+  benchmark-python.py --save-baseline             # record a new baseline
+  benchmark-python.py --list
+
+Exit status is 2 when a stage regresses beyond the thresholds.
+
+Copyright 2026 Hewlett Packard Enterprise Development LP
+License: MIT
+"""
+
+import sys
+import json
+import time
+import random
+import shutil
+import platform
+import tempfile
+import tracemalloc
+import importlib.util
+import importlib.machinery
+import argparse
+from pathlib import Path
+from typing import List, Dict, Any, Callable, Optional
+
+DEV_DIR = Path(__file__).resolve().parent.parent
+TOOLS_DIR = DEV_DIR / 'tools'
+POST_PROC = DEV_DIR.parent / 'doc' / 'examples' / 'post_proc.py'
+DEFAULT_BASELINE = Path(__file__).resolve().parent / 'results' / 'benchmark-baseline.json'
+
+# Slowdowns below this many seconds are timer and scheduler noise
+TIME_FLOOR = 0.05
+# Fewer timed runs than this are too noisy to flag time regressions
+MIN_TIMED_REPEAT = 3
+
+sys.path.insert(0, str(TOOLS_DIR))
+
+
+def load_module(name: str, path: Path):
+    """Import a tool script (the tools have no .py extension)"""
+    loader = importlib.machinery.SourceFileLoader(name, str(path))
+    spec = importlib.util.spec_from_loader(name, loader)
+    module = importlib.util.module_from_spec(spec)
+    loader.exec_module(module)
+    return module
+
+
+class SkipStage(Exception):
+    """A stage cannot run here (missing optional dependency)"""
+
+
+class Generators:
+    """Deterministic synthetic netperf output, written in chunks"""
+    
+    TESTS = ('TCP_STREAM', 'TCP_RR', 'UDP_STREAM', 'UDP_RR')
+    HOSTS = ('node01', 'node02', 'node03', 'node04')
+    CHUNK = 10000
+    
+    @staticmethod
+    def record(rng: random.Random, index: int) -> Dict[str, Any]:
+        """One omni result with the fields netperf emits most often"""
+        test = Generators.TESTS[index % len(Generators.TESTS)]
+        return {
+            'THROUGHPUT': round(rng.gauss(9400.0, 120.0), 2),
+            'THROUGHPUT_UNITS': '10^6bits/s' if test.endswith('STREAM') else 'Trans/s',
+            'MEAN_LATENCY': round(rng.gauss(48.0, 3.0), 2),
+            'P99_LATENCY': round(rng.gauss(95.0, 6.0), 2),
+            'LOCAL_CPU_UTIL': round(rng.uniform(10.0, 60.0), 2),
+            'REMOTE_CPU_UTIL': round(rng.uniform(10.0, 60.0), 2),
+            'PROTOCOL': test.split('_')[0],
+            'SOCKET_TYPE': 'SOCK_STREAM' if test.startswith('TCP') else 'SOCK_DGRAM',
+            'REQUEST_SIZE': 64 << (index % 5),
+            'ELAPSED_TIME': 10.0,
+            'COMMAND_LINE': f"netperf -H {Generators.HOSTS[index % 4]} -t {test} -l 10",
+        }
+    
+    @staticmethod
+    def _write(path: Path, rows: int, header: Optional[str], footer: Optional[str],
+               line: Callable[[random.Random, int], str]):
+        rng = random.Random(rows)
+        with open(path, 'w') as f:
+            if header:
+                f.write(header)
+            for start in range(0, rows, Generators.CHUNK):
+                f.write(''.join(line(rng, i) for i in range(start, min(rows, start + Generators.CHUNK))))
+            if footer:
+                f.write(footer)
+    
+    @staticmethod
+    def keyval(path: Path, rows: int):
+        """netperf -- -k output, one record per row"""
+        Generators._write(path, rows, None, None,
+                          lambda rng, i: ''.join(f"{key}={value}\n"
+                                                 for key, value in Generators.record(rng, i).items()))
+    
+    @staticmethod
+    def csv(path: Path, rows: int):
+        """netperf -- -o output with a header row"""
+        keys = list(Generators.record(random.Random(0), 0))
+        
+        def line(rng, i):
+            values = [str(v) for v in Generators.record(rng, i).values()]
+            values[-1] = f'"{values[-1]}"'
+            return ','.join(values) + '\n'
+        
+        Generators._write(path, rows, ','.join(keys) + '\n', None, line)
+    
+    @staticmethod
+    def json(path: Path, rows: int):
+        """netperf -- -J output collected into one array"""
+        def line(rng, i):
+            record = {'metadata': {'hostname': Generators.HOSTS[i % 4],
+                                   'timestamp': f"2026-01-01T00:{i // 60 % 60:02d}:{i % 60:02d}"},
+                      'results': Generators.record(rng, i)}
+            return (',\n' if i else '') + json.dumps(record)
+        
+        Generators._write(path, rows, '[\n', '\n]\n', line)
+    
+    @staticmethod
+    def jsonl(path: Path, rows: int):
+        """netperf -- -J output, one result per line"""
+        Generators._write(path, rows, None, None,
+                          lambda rng, i: json.dumps({'metadata': {'hostname': Generators.HOSTS[i % 4]},
+                                                     'results': Generators.record(rng, i)}) + '\n')
+    
+    @staticmethod
+    def interim(path: Path, rows: int):
+        """Demo-mode interim results (-D) in the human, keyval and CSV forms"""
+        start = 1767225600.0
+        
+        def line(rng, i):
+            value = rng.gauss(9400.0, 300.0)
+            end = start + i * 0.5
+            form = i % 3
+            if form == 0:
+                return f"Interim result: {value:7.2f} 10^6bits/s over 0.500 seconds ending at {end:.3f}\n"
+            if form == 1:
+                return (f"NETPERF_INTERIM_RESULT[0]={value:.2f}\nNETPERF_UNITS[0]=10^6bits/s\n"
+                        f"NETPERF_INTERVAL[0]=0.500\nNETPERF_ENDING[0]={end:.3f}\n")
+            return f"{value:.2f},10^6bits/s,0.500,{end:.3f}\n"
+        
+        Generators._write(path, rows, None, None, line)
+
+
+class Stages:
+    """Benchmarked code paths
+    
+    Each stage has a setup (builds the input, not measured) that returns
+    the callable to measure.
+    """
+    
+    def __init__(self, data_dir: Path):
+        self.data_dir = data_dir
+        self._modules = {}
+    
+    def module(self, name: str):
+        if name not in self._modules:
+            if name == 'aggregate':
+                self._modules[name] = load_module('netperf_aggregate', TOOLS_DIR / 'netperf-aggregate')
+            elif name == 'template':
+                self._modules[name] = load_module('netperf_template', TOOLS_DIR / 'netperf-template')
+            elif name == 'stats':
+                import netperf_stats
+                self._modules[name] = netperf_stats
+            elif name == 'post_proc':
+                try:
+                    self._modules[name] = load_module('post_proc', POST_PROC)
+                except ImportError as e:
+                    raise SkipStage(f"post_proc.py needs {e.name}")
+        return self._modules[name]
+    
+    def data(self, kind: str, rows: int) -> Path:
+        """Synthetic input file, generated once per run"""
+        suffix = {'keyval': 'txt', 'interim': 'log'}.get(kind, kind)
+        path = self.data_dir / f"{kind}-{rows}.{suffix}"
+        if not path.exists():
+            getattr(Generators, kind)(path, rows)
+        return path
+    
+    def parser(self, kind: str, method: str):
+        def setup(rows):
+            path = self.data(kind, rows)
+            parse = getattr(self.module('aggregate').ResultParser, method)
+            return lambda: parse(path)
+        return setup
+    
+    def ingest(self, kind: str):
+        def setup(rows):
+            path = str(self.data(kind, rows))
+            # One worker keeps parsing in-process, where tracemalloc sees it
+            pipeline = self.module('aggregate').IngestPipeline(workers=1)
+            return lambda: pipeline.load([path])
+        return setup
+    
+    def interim_lines(self, rows: int):
+        path = self.data('interim', rows)
+        parse = self.module('stats').parse_interim_line
+        
+        def run():
+            with open(path) as f:
+                return sum(1 for line in f if parse(line) is not None)
+        return run
+    
+    def interim_parser(self, rows: int):
+        path = self.data('interim', rows)
+        InterimParser = self.module('stats').InterimParser
+        
+        def run():
+            parser = InterimParser()
+            with open(path) as f:
+                return sum(1 for line in f if parser.feed(line) is not None)
+        return run
+    
+    def stats(self, rows: int):
+        values = [random.Random(rows).gauss(9400.0, 120.0) for _ in range(rows)]
+        calculate = self.module('stats').AdvancedStatistics.calculate_comprehensive_stats
+        return lambda: calculate(values)
+    
+    def template(self, rows: int):
+        tool = self.module('template')
+        engine = tool.SimpleTemplateEngine()
+        engine.register_filter('format_throughput', tool.TemplateEngine._format_throughput)
+        engine.register_filter('format_latency', tool.TemplateEngine._format_latency)
+        rng = random.Random(rows)
+        results = [{'test_name': Generators.TESTS[i % 4], 'throughput': rng.gauss(9400.0, 120.0),
+                    'latency': rng.gauss(48.0, 3.0), 'host': Generators.HOSTS[i % 4]}
+                   for i in range(rows)]
+        # Variables are substituted before loops are expanded, so filters
+        # only apply outside {% for %} bodies in the simple engine
+        template = ("# {{ title }}\n\nPeak: {{ peak|format_throughput }}, {{ best|format_latency }}\n\n"
+                    "{% if show_table %}| Test | Host | Throughput | Latency |\n{% endif %}"
+                    "{% for r in results %}| {{ r.test_name }} | {{ r.host }} | "
+                    "{{ r.throughput }} | {{ r.latency }} |\n{% endfor %}")
+        context = {'title': 'Benchmark', 'show_table': True, 'results': results,
+                   'peak': max(r['throughput'] for r in results), 'best': min(r['latency'] for r in results)}
+        return lambda: engine.render(template, context)
+    
+    def post_proc(self, rows: int):
+        process_result = self.module('post_proc').process_result
+        path = self.data('interim', rows)
+        workdir = Path(tempfile.mkdtemp(dir=self.data_dir))
+        end_time = 1767225600 + rows // 2 + 10
+        
+        def run():
+            with open(path) as f:
+                process_result(str(workdir / 'bench'), f, end_time, {})
+            for rrd in workdir.glob('*.rrd'):
+                rrd.unlink()
+        return run
+    
+    def catalog(self) -> Dict[str, Callable[[int], Callable[[], Any]]]:
+        return {
+            'parse.keyval': self.parser('keyval', 'parse_keyval_file'),
+            'parse.csv': self.parser('csv', 'parse_csv_file'),
+            'parse.json': self.parser('json', 'parse_json_file'),
+            'parse.jsonl': self.parser('jsonl', 'parse_json_file'),
+            'ingest.keyval': self.ingest('keyval'),
+            'ingest.csv': self.ingest('csv'),
+            'ingest.json': self.ingest('json'),
+            'ingest.jsonl': self.ingest('jsonl'),
+            'interim.parse_line': self.interim_lines,
+            'interim.parser': self.interim_parser,
+            'stats.comprehensive': self.stats,
+            'template.render': self.template,
+            'post_proc.interim': self.post_proc,
+        }
+
+
+def measure(run: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    """Best wall time over repeat runs, then peak traced memory of one run"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {'seconds': min(times), 'peak_mb': peak / (1024 * 1024)}
+
+
+def compare(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]],
+            time_threshold: float, memory_threshold: float, check_time: bool = True) -> List[str]:
+    """Mark results that regressed against the baseline
+    
+    A stage regresses when it is slower (or uses more memory) than the
+    baseline by more than the threshold percentage and by more than an
+    absolute floor (TIME_FLOOR, 1 MB), so tiny sizes do not flap on timer
+    noise. With check_time False only memory is checked.
+    
+    Returns:
+        Keys of regressed results
+    """
+    regressed = []
+    for key, current in results.items():
+        base = baseline.get(key)
+        if not base or 'seconds' not in current:
+            continue
+        current['time_change'] = (current['seconds'] / base['seconds'] - 1) * 100 if base['seconds'] else 0.0
+        current['memory_change'] = (current['peak_mb'] / base['peak_mb'] - 1) * 100 if base['peak_mb'] else 0.0
+        slower = (check_time and current['time_change'] > time_threshold
+                  and current['seconds'] - base['seconds'] > TIME_FLOOR)
+        larger = current['memory_change'] > memory_threshold and current['peak_mb'] - base['peak_mb'] > 1.0
+        current['status'] = 'REGRESSION' if slower or larger else 'ok'
+        if slower or larger:
+            regressed.append(key)
+    return regressed
+
+
+def format_table(results: Dict[str, Dict[str, Any]]) -> str:
+    """Results as a text table"""
+    lines = [f"{'Stage':<22} {'Rows':>10} {'Time (s)':>10} {'Change':>8} {'Peak MB':>9} {'Change':>8}  Status",
+             '-' * 82]
+    for key, r in results.items():
+        stage, rows = key.split('@')
+        if 'skipped' in r:
+            lines.append(f"{stage:<22} {int(rows):>10}  skipped: {r['skipped']}")
+            continue
+        time_change = f"{r['time_change']:+.1f}%" if 'time_change' in r else '-'
+        memory_change = f"{r['memory_change']:+.1f}%" if 'memory_change' in r else '-'
+        lines.append(f"{stage:<22} {int(rows):>10} {r['seconds']:>10.4f} {time_change:>8} "
+                     f"{r['peak_mb']:>9.2f} {memory_change:>8}  {r.get('status', 'new')}")
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark the Python tooling hot paths',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s
+  %(prog)s --sizes 1e6 --stage ingest interim
+  %(prog)s --save-baseline
+        """
+    )
+    parser.add_argument('--stage', nargs='+', metavar='NAME', help='Stages to run (prefix match, default: all)')
+    parser.add_argument('--sizes', nargs='+', type=float, default=[1e3, 1e4, 1e5],
+                        help='Input sizes in rows (default: 1e3 1e4 1e5)')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Timed runs per stage, best is kept; times are only checked for '
+                             f'regressions with at least {MIN_TIMED_REPEAT} (default: 3)')
+    parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE,
+                        help='Baseline file (default: dev/tests/results/benchmark-baseline.json)')
+    parser.add_argument('--save-baseline', action='store_true', help='Write the results as the new baseline')
+    parser.add_argument('--time-threshold', type=float, default=25.0,
+                        help='Allowed slowdown in percent (default: 25)')
+    parser.add_argument('--memory-threshold', type=float, default=10.0,
+                        help='Allowed peak memory growth in percent (default: 10)')
+    parser.add_argument('--data-dir', type=Path, help='Keep generated inputs here (default: temporary)')
+    parser.add_argument('-o', '--output', type=Path, help='Write results as JSON')
+    parser.add_argument('--list', action='store_true', help='List stages')
+    args = parser.parse_args()
+    
+    data_dir = args.data_dir or Path(tempfile.mkdtemp(prefix='netperf-bench-'))
+    data_dir.mkdir(parents=True, exist_ok=True)
+    stages = Stages(data_dir)
+    catalog = stages.catalog()
+    if args.list:
+        print('\n'.join(catalog))
+        return 0
+    
+    selected = [name for name in catalog
+                if not args.stage or any(name.startswith(prefix) for prefix in args.stage)]
+    if not selected:
+        print(f"Error: No stage matches {' '.join(args.stage)}", file=sys.stderr)
+        return 1
+    
+    results = {}
+    try:
+        for name in selected:
+            for rows in sorted(int(size) for size in args.sizes):
+                key = f"{name}@{rows}"
+                print(f"Running {key}...", file=sys.stderr)
+                try:
+                    results[key] = measure(catalog[name](rows), args.repeat)
+                except SkipStage as e:
+                    results[key] = {'skipped': str(e)}
+                    break
+    finally:
+        if not args.data_dir:
+            shutil.rmtree(data_dir, ignore_errors=True)
+    
+    meta = {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+    baseline = {}
+    if args.baseline.exists():
+        with open(args.baseline) as f:
+            baseline = json.load(f).get('results', {})
+    check_time = args.repeat >= MIN_TIMED_REPEAT
+    regressed = compare(results, baseline, args.time_threshold, args.memory_threshold, check_time)
+    
+    print(format_table(results))
+    if baseline and not check_time:
+        print(f"\nTimes not checked for regressions (--repeat {args.repeat} < {MIN_TIMED_REPEAT}); "
+              f"memory only")
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'meta': meta, 'results': results}, f, indent=2)
+    
+    if args.save_baseline:
+        measured = {key: {'seconds': round(r['seconds'], 6), 'peak_mb': round(r['peak_mb'], 3)}
+                    for key, r in results.items() if 'seconds' in r}
+        baseline.update(measured)
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.baseline, 'w') as f:
+            json.dump({'meta': meta, 'results': dict(sorted(baseline.items()))}, f, indent=2)
+        print(f"\nBaseline saved to {args.baseline} ({len(measured)} result(s))")
+        return 0
+    
+    if regressed:
+        print(f"\n{len(regressed)} regression(s): {', '.join(regressed)}")
+        return 2
+    if not baseline:
+        print(f"\nNo baseline at {args.baseline}; run with --save-baseline to record one")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
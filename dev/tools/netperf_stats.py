@@ -11,19 +11,93 @@ Version: 2.0.0
 """
 
 import math
+import os
 import random
 import statistics
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from typing import List, Dict, Any, Tuple, Optional
 
+# Optional NumPy backend for large sample sets
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 
 class AdvancedStatistics:
     """Advanced statistical analysis for netperf results"""
     
+    # Sample size at which backend='auto' switches to the NumPy engine
+    NUMPY_MIN_SAMPLES = 1000
+    
+    # Sample size from which ci_method='auto' bootstraps (t-interval below)
+    BOOTSTRAP_MIN_SAMPLES = 30
+    # Resampled values ci_method='auto' draws at most, by using fewer
+    # resamples for large samples (but never fewer than the minimum)
+    AUTO_BOOTSTRAP_DRAWS = 10 ** 8
+    AUTO_BOOTSTRAP_MIN_RESAMPLES = 1000
+    
+    @staticmethod
+    def ci_plan(method: str, n: int,
+                bootstrap: Optional['BootstrapEngine'] = None) -> Tuple[str, Optional['BootstrapEngine']]:
+        """Resolve a CI method at sample size n
+        
+        'auto' is the t-interval below BOOTSTRAP_MIN_SAMPLES and the
+        percentile bootstrap from there on, with the resample count cut
+        so that large samples cost about AUTO_BOOTSTRAP_DRAWS draws.
+        
+        Returns:
+            (method, BootstrapEngine for bootstrap methods or None)
+        """
+        auto = method == 'auto'
+        if auto:
+            method = 't-dist' if n < AdvancedStatistics.BOOTSTRAP_MIN_SAMPLES else 'bootstrap'
+        if method not in BootstrapEngine.CI_METHODS:
+            return method, None
+        engine = bootstrap or BootstrapEngine()
+        if auto:
+            resamples = max(AdvancedStatistics.AUTO_BOOTSTRAP_MIN_RESAMPLES,
+                            AdvancedStatistics.AUTO_BOOTSTRAP_DRAWS // n)
+            if resamples < engine.n_bootstrap:
+                engine = BootstrapEngine(resamples, engine.seed, engine.workers, engine.block_elements)
+        return method, engine
+    
+    @staticmethod
+    def _array_engine(values, backend: str = 'auto') -> Optional['_ArrayStatistics']:
+        """Select the computation backend for a sample
+        
+        Args:
+            values: List (or NumPy array) of numeric values
+            backend: 'auto', 'numpy', or 'python'
+        
+        Returns:
+            An _ArrayStatistics engine, or None to use the pure Python path
+        """
+        if backend == 'python':
+            return None
+        if backend == 'numpy':
+            if not HAS_NUMPY:
+                raise ImportError("NumPy backend requested but numpy is not installed")
+            return _ArrayStatistics(values)
+        if backend != 'auto':
+            raise ValueError(f"Unknown statistics backend: {backend}")
+        
+        if not HAS_NUMPY:
+            return None
+        if isinstance(values, np.ndarray) or len(values) >= AdvancedStatistics.NUMPY_MIN_SAMPLES:
+            return _ArrayStatistics(values)
+        return None
+    
     @staticmethod
     def calculate_comprehensive_stats(values: List[float], 
                                      confidence_level: float = 0.95,
                                      detect_outliers: bool = True,
-                                     outlier_method: str = 'iqr') -> Dict[str, Any]:
+                                     outlier_method: str = 'iqr',
+                                     backend: str = 'auto',
+                                     ci_method: str = 'auto',
+                                     bootstrap: Optional['BootstrapEngine'] = None) -> Dict[str, Any]:
         """Calculate comprehensive statistics with CI, outliers, and distribution analysis
         
         Args:
@@ -31,13 +105,24 @@ class AdvancedStatistics:
             confidence_level: Confidence level for CI (default 0.95 for 95%)
             detect_outliers: Whether to detect and report outliers
             outlier_method: 'iqr' or 'zscore'
+            backend: 'auto' (NumPy for large samples when available),
+                     'numpy', or 'python'
+            ci_method: CI method passed to confidence_interval(); the
+                       method used is reported as 'ci_method', with
+                       'bootstrap_resamples' for bootstrap methods
+            bootstrap: BootstrapEngine for bootstrap CIs (default settings if None)
             
         Returns:
             Dictionary with comprehensive statistical measures
         """
-        if not values:
+        if len(values) == 0:
             return {}
         
+        engine = AdvancedStatistics._array_engine(values, backend)
+        if engine is not None:
+            return engine.comprehensive_stats(confidence_level, detect_outliers, outlier_method,
+                                              ci_method, bootstrap)
+        
         n = len(values)
         values_sorted = sorted(values)
         
@@ -71,12 +156,16 @@ class AdvancedStatistics:
         
         # Confidence intervals (requires n >= 2)
         if n >= 2:
-            ci = AdvancedStatistics.confidence_interval(values, confidence_level)
+            method, engine = AdvancedStatistics.ci_plan(ci_method, n, bootstrap)
+            ci = AdvancedStatistics.confidence_interval(values, confidence_level, method, engine)
             stats['ci_lower'] = ci[0]
             stats['ci_upper'] = ci[1]
             stats['ci_margin'] = (ci[1] - ci[0]) / 2
             stats['ci_level'] = confidence_level
             stats['ci_range'] = ci[1] - ci[0]
+            stats['ci_method'] = method
+            if engine is not None:
+                stats['bootstrap_resamples'] = engine.n_bootstrap
         
         # Outlier detection
         if detect_outliers and n >= 4:
@@ -112,13 +201,17 @@ class AdvancedStatistics:
     
     @staticmethod
     def confidence_interval(values: List[float], confidence: float = 0.95,
-                           method: str = 'auto') -> Tuple[float, float]:
+                           method: str = 'auto',
+                           bootstrap: Optional['BootstrapEngine'] = None) -> Tuple[float, float]:
         """Calculate confidence interval
         
         Args:
             values: List of numeric values
             confidence: Confidence level (0.95 for 95%, 0.99 for 99%)
-            method: 'auto', 't-dist', or 'bootstrap'
+            method: 'auto', 't-dist', 'bootstrap' (percentile), 'bca',
+                    or 'percentile-t'
+            bootstrap: BootstrapEngine for the bootstrap methods
+                       (default settings if None)
             
         Returns:
             Tuple of (lower_bound, upper_bound)
@@ -128,14 +221,12 @@ class AdvancedStatistics:
             mean_val = values[0] if values else 0
             return (mean_val, mean_val)
         
-        if method == 'auto':
-            # Use t-distribution for small samples, bootstrap for large
-            method = 't-dist' if n < 30 else 'bootstrap'
+        method, engine = AdvancedStatistics.ci_plan(method, n, bootstrap)
         
         if method == 't-dist':
             return AdvancedStatistics._t_confidence_interval(values, confidence)
-        elif method == 'bootstrap':
-            return AdvancedStatistics._bootstrap_confidence_interval(values, confidence)
+        elif engine is not None:
+            return engine.confidence_interval(values, confidence, BootstrapEngine.CI_METHODS[method])
         else:
             raise ValueError(f"Unknown CI method: {method}")
     
@@ -208,7 +299,7 @@ class AdvancedStatistics:
     @staticmethod
     def _bootstrap_confidence_interval(values: List[float], confidence: float,
                                       n_bootstrap: int = 10000) -> Tuple[float, float]:
-        """Calculate CI using bootstrap resampling
+        """Calculate CI using bootstrap resampling (percentile method)
         
         Args:
             values: Original sample
@@ -218,24 +309,12 @@ class AdvancedStatistics:
         Returns:
             Confidence interval bounds
         """
-        means = []
-        n = len(values)
-        
-        random.seed(42)  # Reproducible results
-        for _ in range(n_bootstrap):
-            sample = random.choices(values, k=n)
-            means.append(statistics.mean(sample))
-        
-        means_sorted = sorted(means)
-        alpha = 1 - confidence
-        lower_idx = int(n_bootstrap * (alpha / 2))
-        upper_idx = int(n_bootstrap * (1 - alpha / 2))
-        
-        return (means_sorted[lower_idx], means_sorted[upper_idx])
+        return BootstrapEngine(n_bootstrap).confidence_interval(values, confidence, 'percentile')
     
     @staticmethod
     def detect_outliers(values: List[float], method: str = 'iqr',
-                       iqr_factor: float = 1.5, zscore_threshold: float = 3.0) -> Dict[str, Any]:
+                       iqr_factor: float = 1.5, zscore_threshold: float = 3.0,
+                       backend: str = 'auto') -> Dict[str, Any]:
         """Detect outliers using IQR or Z-score method
         
         Args:
@@ -243,10 +322,22 @@ class AdvancedStatistics:
             method: 'iqr' (Interquartile Range) or 'zscore'
             iqr_factor: IQR multiplier (1.5 standard, 3.0 for extreme outliers)
             zscore_threshold: Z-score threshold (3.0 standard, 2.0 for moderate)
+            backend: 'auto', 'numpy', or 'python'
             
         Returns:
             Dictionary with outliers, indices, clean values, and method info
         """
+        if method not in ('iqr', 'zscore'):
+            raise ValueError(f"Unknown outlier detection method: {method}")
+        
+        engine = AdvancedStatistics._array_engine(values, backend)
+        if engine is not None:
+            if method == 'iqr':
+                info, _ = engine.outliers_iqr(iqr_factor)
+            else:
+                info, _ = engine.outliers_zscore(zscore_threshold)
+            return info
+        
         if method == 'iqr':
             return AdvancedStatistics._detect_outliers_iqr(values, iqr_factor)
         elif method == 'zscore':
@@ -376,7 +467,7 @@ class AdvancedStatistics:
         }
     
     @staticmethod
-    def analyze_distribution(values: List[float]) -> Dict[str, Any]:
+    def analyze_distribution(values: List[float], backend: str = 'auto') -> Dict[str, Any]:
         """Analyze distribution characteristics
         
         Calculates skewness, kurtosis, and performs normality testing.
@@ -391,6 +482,10 @@ class AdvancedStatistics:
         - > 0: Heavy-tailed (leptokurtic)
         - < 0: Light-tailed (platykurtic)
         """
+        engine = AdvancedStatistics._array_engine(values, backend)
+        if engine is not None:
+            return engine.distribution()
+        
         n = len(values)
         if n < 3:
             return {
@@ -535,14 +630,12 @@ class AdvancedStatistics:
             # Pooled t-test
             pooled_var = ((n1 - 1) * var1 + (n2 - 1) * var2) / (n1 + n2 - 2)
             se = math.sqrt(pooled_var * (1/n1 + 1/n2))
-            df = n1 + n2 - 2
         else:
             # Welch's t-test (unequal variances)
             se = math.sqrt(var1/n1 + var2/n2)
-            # Welch-Satterthwaite degrees of freedom
-            df = (var1/n1 + var2/n2)**2 / ((var1/n1)**2/(n1-1) + (var2/n2)**2/(n2-1))
-            df = int(df)
+        df = n1 + n2 - 2
         
+        # Checked before the Welch df, which divides by the variances
         if se == 0:
             return {
                 't_statistic': 0,
@@ -552,10 +645,15 @@ class AdvancedStatistics:
                 'error': 'Zero standard error (no variation)'
             }
         
+        if not equal_var:
+            # Welch-Satterthwaite degrees of freedom
+            # (kept fractional: the t CDF accepts non-integer df)
+            df = (var1/n1 + var2/n2)**2 / ((var1/n1)**2/(n1-1) + (var2/n2)**2/(n2-1))
+        
         # T-statistic
         t_stat = (mean1 - mean2) / se
         
-        # Approximate p-value (two-tailed)
+        # Two-tailed p-value
         p_value = AdvancedStatistics._t_to_p_value(abs(t_stat), df)
         
         return {
@@ -572,44 +670,29 @@ class AdvancedStatistics:
         }
     
     @staticmethod
-    def _t_to_p_value(t: float, df: int) -> float:
-        """Approximate two-tailed p-value from t-statistic
-        
-        For production with scipy: scipy.stats.t.sf(abs(t), df) * 2
+    def _t_to_p_value(t: float, df: float) -> float:
+        """Two-tailed p-value from t-statistic
         
-        This uses lookup tables for common critical values.
+        Uses the regularized incomplete beta function, equivalent to
+        scipy.stats.t.sf(abs(t), df) * 2.
         """
-        # Common critical values for two-tailed test
-        if df >= 30:
-            if abs(t) < 1.96:
-                return 0.10
-            elif abs(t) < 2.042:
-                return 0.05
-            elif abs(t) < 2.750:
-                return 0.01
-            else:
-                return 0.001
-        elif df >= 20:
-            if abs(t) < 2.086:
-                return 0.05
-            elif abs(t) < 2.845:
-                return 0.01
-            else:
-                return 0.001
-        elif df >= 10:
-            if abs(t) < 2.228:
-                return 0.05
-            elif abs(t) < 3.169:
-                return 0.01
-            else:
-                return 0.001
-        else:
-            if abs(t) < 2.5:
-                return 0.05
-            elif abs(t) < 4.0:
-                return 0.01
-            else:
-                return 0.001
+        if df <= 0 or math.isnan(t):
+            return 1.0
+        if math.isinf(t):
+            return 0.0
+        x = df / (df + t * t)
+        return min(1.0, _betainc(df / 2.0, 0.5, x))
+    
+    @staticmethod
+    def t_cdf(t: float, df: float) -> float:
+        """Cumulative distribution function of Student's t distribution"""
+        tail = AdvancedStatistics._t_to_p_value(t, df) / 2.0
+        return 1.0 - tail if t > 0 else tail
+    
+    @staticmethod
+    def normal_cdf(z: float) -> float:
+        """Cumulative distribution function of the standard normal distribution"""
+        return 0.5 * math.erfc(-z / math.sqrt(2.0))
     
     @staticmethod
     def _cohens_d(sample1: List[float], sample2: List[float]) -> float:
@@ -667,51 +750,26 @@ class AdvancedStatistics:
                 'error': 'Empty samples'
             }
         
-        # Combine and rank all values
-        combined = [(val, 1) for val in sample1] + [(val, 2) for val in sample2]
-        combined_sorted = sorted(combined, key=lambda x: x[0])
-        
-        # Assign ranks (handle ties by averaging ranks)
-        ranks = {1: [], 2: []}
-        i = 0
-        while i < len(combined_sorted):
-            value = combined_sorted[i][0]
-            
-            # Find all values equal to current value (ties)
-            j = i
-            while j < len(combined_sorted) and combined_sorted[j][0] == value:
-                j += 1
-            
-            # Average rank for ties
-            avg_rank = (i + j + 1) / 2  # +1 because ranks start at 1
-            
-            # Assign average rank to all tied values
-            for k in range(i, j):
-                group = combined_sorted[k][1]
-                ranks[group].append(avg_rank)
-            
-            i = j
+        # Rank the pooled sample once (ties get their average rank)
+        ranks, tie_sizes = RankEngine.rank(list(sample1) + list(sample2))
         
         # Calculate U statistic
-        r1 = sum(ranks[1])
+        r1 = float(sum(ranks[:n1]))
         u1 = r1 - (n1 * (n1 + 1)) / 2
         u2 = n1 * n2 - u1
         
         u_stat = min(u1, u2)
         
         # Determine significance
-        if n1 > 20 and n2 > 20:
-            # Large sample approximation (normal distribution)
-            mean_u = n1 * n2 / 2
-            std_u = math.sqrt(n1 * n2 * (n1 + n2 + 1) / 12)
-            z = (u_stat - mean_u) / std_u if std_u > 0 else 0
-            p_value = AdvancedStatistics._z_to_p_value(abs(z))
-            significant = p_value < 0.05
+        if not tie_sizes and max(n1, n2) <= RankEngine.EXACT_MAX_SIZE:
+            # Exact null distribution of U (valid only without ties)
+            p_value = RankEngine.exact_p_value(u_stat, n1, n2)
+            method = 'exact'
         else:
-            # Small sample - use critical value heuristic
-            critical_u = min(n1, n2) * max(n1, n2) * 0.3
-            significant = u_stat < critical_u
-            p_value = 0.05 if significant else 0.10
+            # Normal approximation with tie and continuity corrections
+            p_value = RankEngine.normal_p_value(u_stat, n1, n2, tie_sizes)
+            method = 'normal'
+        significant = p_value < 0.05
         
         return {
             'u_statistic': u_stat,
@@ -721,38 +779,58 @@ class AdvancedStatistics:
             'significant': significant,
             'n1': n1,
             'n2': n2,
+            'method': method,
             'interpretation': 'Samples differ significantly' if significant else 'No significant difference'
         }
     
     @staticmethod
     def _z_to_p_value(z: float) -> float:
-        """Approximate two-tailed p-value from z-score"""
-        if abs(z) < 1.645:
-            return 0.10
-        elif abs(z) < 1.96:
-            return 0.05
-        elif abs(z) < 2.576:
-            return 0.01
-        else:
-            return 0.001
+        """Two-tailed p-value from z-score"""
+        return math.erfc(abs(z) / math.sqrt(2.0))
+    
+    @staticmethod
+    def benjamini_hochberg(p_values: List[float]) -> List[float]:
+        """Benjamini-Hochberg false discovery rate adjustment
+        
+        Args:
+            p_values: Raw p-values from independent comparisons
+        
+        Returns:
+            Adjusted p-values (q-values) in input order
+        """
+        m = len(p_values)
+        order = sorted(range(m), key=lambda i: p_values[i], reverse=True)
+        q_values = [1.0] * m
+        running = 1.0
+        for rank, i in zip(range(m, 0, -1), order):
+            running = min(running, p_values[i] * m / rank)
+            q_values[i] = running
+        return q_values
     
     @staticmethod
-    def generate_histogram(values: List[float], bins: int = 10, width: int = 60) -> str:
+    def generate_histogram(values: List[float], bins: int = 10, width: int = 60,
+                           backend: str = 'auto') -> str:
         """Generate ASCII histogram
         
         Args:
             values: Data values
             bins: Number of histogram bins
             width: Character width of histogram
+            backend: 'auto', 'numpy', or 'python'
             
         Returns:
             ASCII art histogram string
         """
-        if not values or bins < 1:
+        if len(values) == 0 or bins < 1:
             return "No data to display"
         
-        min_val = min(values)
-        max_val = max(values)
+        engine = AdvancedStatistics._array_engine(values, backend)
+        if engine is not None:
+            min_val = engine.min()
+            max_val = engine.max()
+        else:
+            min_val = min(values)
+            max_val = max(values)
         range_val = max_val - min_val
         
         if range_val == 0:
@@ -760,11 +838,14 @@ class AdvancedStatistics:
         
         # Create bins
         bin_width = range_val / bins
-        bin_counts = [0] * bins
         
-        for val in values:
-            bin_idx = min(int((val - min_val) / bin_width), bins - 1)
-            bin_counts[bin_idx] += 1
+        if engine is not None:
+            bin_counts = engine.histogram_counts(bins)
+        else:
+            bin_counts = [0] * bins
+            for val in values:
+                bin_idx = min(int((val - min_val) / bin_width), bins - 1)
+                bin_counts[bin_idx] += 1
         
         # Find max count for scaling
         max_count = max(bin_counts)
@@ -868,9 +949,1677 @@ class AdvancedStatistics:
         return "\n".join(lines)
 
 
+class _ArrayStatistics:
+    """NumPy engine behind AdvancedStatistics for large samples
+    
+    The sample is converted to an array and sorted exactly once. Every order
+    statistic (median, percentiles, quartiles, outlier fences, clean medians)
+    is read from that sorted copy, and all moments come from a single vector
+    of deviations from the mean. Results are returned as native Python types
+    with the same keys as the pure Python implementation.
+    """
+    
+    def __init__(self, values):
+        self.values = np.asarray(values, dtype=np.float64)
+        self.sorted = np.sort(self.values)
+        self.n = int(self.values.size)
+        self._moments = None
+    
+    def min(self) -> float:
+        return float(self.sorted[0])
+    
+    def max(self) -> float:
+        return float(self.sorted[-1])
+    
+    @staticmethod
+    def _median(sorted_values) -> float:
+        """Median of an already sorted array"""
+        n = sorted_values.size
+        mid = n // 2
+        if n % 2:
+            return float(sorted_values[mid])
+        return float((sorted_values[mid - 1] + sorted_values[mid]) / 2)
+    
+    def moments(self) -> Tuple[float, float, float, float, float]:
+        """Return (mean, sample variance, sample stddev, m3, m4)
+        
+        m3 and m4 are the population central moments used by
+        analyze_distribution(). Computed on first use and cached.
+        """
+        if self._moments is None:
+            n = self.n
+            if self.sorted[0] == self.sorted[-1]:
+                # Constant sample: avoid rounding noise from the summation
+                self._moments = (float(self.sorted[0]), 0.0, 0.0, 0.0, 0.0)
+            else:
+                mean = float(self.values.mean())
+                dev = self.values - mean
+                sq = dev * dev
+                variance = float(sq.sum()) / (n - 1) if n > 1 else 0.0
+                m3 = float(np.dot(sq, dev)) / n
+                m4 = float(np.dot(sq, sq)) / n
+                self._moments = (mean, variance, math.sqrt(variance), m3, m4)
+        return self._moments
+    
+    def confidence_interval(self, confidence: float, method: str = 'auto',
+                            bootstrap: Optional['BootstrapEngine'] = None) -> Tuple[float, float]:
+        """Same method selection as AdvancedStatistics.confidence_interval()"""
+        method, engine = AdvancedStatistics.ci_plan(method, self.n, bootstrap)
+        if method == 't-dist':
+            mean, _, stddev, _, _ = self.moments()
+            margin = AdvancedStatistics._t_critical(self.n - 1, confidence) * stddev / math.sqrt(self.n)
+            return (mean - margin, mean + margin)
+        return AdvancedStatistics.confidence_interval(self.values, confidence, method, engine)
+    
+    def comprehensive_stats(self, confidence_level: float, detect_outliers: bool,
+                            outlier_method: str, ci_method: str = 'auto',
+                            bootstrap: Optional['BootstrapEngine'] = None) -> Dict[str, Any]:
+        """Array implementation of AdvancedStatistics.calculate_comprehensive_stats()"""
+        n = self.n
+        a = self.sorted
+        mean, variance, stddev, _, _ = self.moments()
+        
+        stats = {
+            'count': n,
+            'mean': mean,
+            'median': self._median(a),
+            'min': self.min(),
+            'max': self.max(),
+            'range': self.max() - self.min(),
+        }
+        
+        if n >= 2:
+            stats['stddev'] = stddev
+            stats['variance'] = variance
+            stats['coefficient_of_variation'] = (stddev / mean * 100) if mean != 0 else 0
+            stats['std_error'] = stddev / math.sqrt(n)
+        else:
+            stats['stddev'] = 0
+            stats['variance'] = 0
+            stats['coefficient_of_variation'] = 0
+            stats['std_error'] = 0
+        
+        stats['p50'] = float(a[int(n * 0.50)])
+        stats['p90'] = float(a[int(n * 0.90)]) if n > 1 else float(a[0])
+        stats['p95'] = float(a[int(n * 0.95)]) if n > 1 else float(a[0])
+        stats['p99'] = float(a[int(n * 0.99)]) if n > 1 else float(a[0])
+        
+        if n >= 2:
+            method, engine = AdvancedStatistics.ci_plan(ci_method, n, bootstrap)
+            ci = self.confidence_interval(confidence_level, method, engine)
+            stats['ci_lower'] = ci[0]
+            stats['ci_upper'] = ci[1]
+            stats['ci_margin'] = (ci[1] - ci[0]) / 2
+            stats['ci_level'] = confidence_level
+            stats['ci_range'] = ci[1] - ci[0]
+            stats['ci_method'] = method
+            if engine is not None:
+                stats['bootstrap_resamples'] = engine.n_bootstrap
+        
+        if detect_outliers and n >= 4:
+            if outlier_method == 'iqr':
+                info, clean_sorted = self.outliers_iqr(materialize_clean=False)
+            elif outlier_method == 'zscore':
+                info, clean_sorted = self.outliers_zscore(materialize_clean=False)
+            else:
+                raise ValueError(f"Unknown outlier detection method: {outlier_method}")
+            
+            stats['outliers'] = info['outliers']
+            stats['outlier_count'] = len(info['outliers'])
+            stats['outlier_indices'] = info['indices']
+            stats['outlier_percentage'] = (len(info['outliers']) / n) * 100
+            
+            if stats['outlier_count'] > 0 and clean_sorted.size >= 2:
+                stats['mean_clean'] = float(clean_sorted.mean())
+                stats['median_clean'] = self._median(clean_sorted)
+                stats['stddev_clean'] = float(clean_sorted.std(ddof=1))
+                stats['improvement_pct'] = ((stats['mean_clean'] - mean) / mean * 100) if mean != 0 else 0
+        
+        if n >= 3:
+            dist_info = self.distribution()
+            stats['skewness'] = dist_info['skewness']
+            stats['kurtosis'] = dist_info['kurtosis']
+            stats['skewness_interpretation'] = dist_info['interpretation']['skewness']
+            stats['kurtosis_interpretation'] = dist_info['interpretation']['kurtosis']
+            
+            if n >= 8:
+                stats['is_normal'] = dist_info['is_normal']
+                stats['normality_p_value'] = dist_info['p_value']
+            else:
+                stats['is_normal'] = None
+                stats['normality_p_value'] = None
+        
+        return stats
+    
+    def _split(self, mask, method: str, materialize_clean: bool) -> Dict[str, Any]:
+        """Build the outlier/clean lists shared by both detection methods"""
+        return {
+            'outliers': self.values[mask].tolist(),
+            'indices': np.flatnonzero(mask).tolist(),
+            'clean_values': self.values[~mask].tolist() if materialize_clean else None,
+            'method': method,
+        }
+    
+    def outliers_iqr(self, factor: float = 1.5,
+                     materialize_clean: bool = True) -> Tuple[Dict[str, Any], Any]:
+        """IQR outlier detection
+        
+        Returns:
+            (info dict as from _detect_outliers_iqr, sorted clean-value array)
+        """
+        if self.n < 4:
+            info = AdvancedStatistics._detect_outliers_iqr(self.values.tolist(), factor)
+            return info, self.sorted
+        
+        a = self.sorted
+        n = self.n
+        q1 = float(a[n // 4])
+        q3 = float(a[(3 * n) // 4])
+        iqr = q3 - q1
+        lower_fence = q1 - factor * iqr
+        upper_fence = q3 + factor * iqr
+        
+        below = self.values < lower_fence
+        above = self.values > upper_fence
+        info = self._split(below | above, 'iqr', materialize_clean)
+        info.update({
+            'factor': factor,
+            'lower_fence': lower_fence,
+            'upper_fence': upper_fence,
+            'q1': q1,
+            'q3': q3,
+            'iqr': iqr,
+            'below_lower': int(np.count_nonzero(below)),
+            'above_upper': int(np.count_nonzero(above)),
+        })
+        
+        # Non-outliers form a contiguous run of the sorted sample
+        lo = int(np.searchsorted(a, lower_fence, side='left'))
+        hi = int(np.searchsorted(a, upper_fence, side='right'))
+        return info, a[lo:hi]
+    
+    def outliers_zscore(self, threshold: float = 3.0,
+                        materialize_clean: bool = True) -> Tuple[Dict[str, Any], Any]:
+        """Z-score outlier detection
+        
+        Returns:
+            (info dict as from _detect_outliers_zscore, sorted clean-value array)
+        """
+        mean, _, stddev, _, _ = self.moments()
+        if self.n < 3 or stddev == 0:
+            info = AdvancedStatistics._detect_outliers_zscore(self.values.tolist(), threshold)
+            return info, self.sorted
+        
+        z_scores = (self.values - mean) / stddev
+        mask = np.abs(z_scores) > threshold
+        info = self._split(mask, 'zscore', materialize_clean)
+        info.update({
+            'threshold': threshold,
+            'mean': mean,
+            'stddev': stddev,
+            'z_scores': z_scores.tolist(),
+            'max_z_score': float(np.abs(z_scores).max()),
+        })
+        
+        # Apply the identical test to the sorted copy to keep its clean run
+        a = self.sorted
+        return info, a[np.abs((a - mean) / stddev) <= threshold]
+    
+    def distribution(self) -> Dict[str, Any]:
+        """Array implementation of AdvancedStatistics.analyze_distribution()"""
+        mean, _, stddev, m3, m4 = self.moments()
+        if self.n < 3 or stddev == 0:
+            return AdvancedStatistics.analyze_distribution(self.values.tolist(), backend='python')
+        
+        skewness = m3 / (stddev ** 3)
+        kurtosis = (m4 / (stddev ** 4)) - 3
+        is_normal, p_value = self._normality(mean, stddev)
+        
+        return {
+            'skewness': skewness,
+            'kurtosis': kurtosis,
+            'is_normal': is_normal,
+            'p_value': p_value,
+            'interpretation': {
+                'skewness': AdvancedStatistics._interpret_skewness(skewness),
+                'kurtosis': AdvancedStatistics._interpret_kurtosis(kurtosis)
+            }
+        }
+    
+    def _normality(self, mean: float, stddev: float) -> Tuple[bool, float]:
+        """Empirical-rule test of AdvancedStatistics._test_normality()
+        
+        Counts within k standard deviations are two binary searches on the
+        sorted sample instead of a pass over the data per k.
+        """
+        a = self.sorted
+        pct = []
+        for k in (1, 2, 3):
+            lo = np.searchsorted(a, mean - k * stddev, side='left')
+            hi = np.searchsorted(a, mean + k * stddev, side='right')
+            pct.append(int(hi - lo) / self.n)
+        
+        deviation = (
+            abs(pct[0] - 0.6827) * 2 +
+            abs(pct[1] - 0.9545) * 1.5 +
+            abs(pct[2] - 0.9973) * 1
+        )
+        p_value = max(0.001, 1.0 - deviation)
+        return (p_value > 0.05, p_value)
+    
+    def histogram_counts(self, bins: int) -> List[int]:
+        """Bin counts using the same bin assignment as generate_histogram()"""
+        min_val = self.sorted[0]
+        bin_width = (self.sorted[-1] - min_val) / bins
+        idx = ((self.values - min_val) / bin_width).astype(np.int64)
+        np.minimum(idx, bins - 1, out=idx)
+        return np.bincount(idx, minlength=bins).tolist()
+
+
+# Sample shared with bootstrap worker processes (set by the pool initializer)
+_BOOTSTRAP_SAMPLE = None
+
+
+def _bootstrap_worker_init(values):
+    """Process pool initializer: ship the sample to each worker once"""
+    global _BOOTSTRAP_SAMPLE
+    _BOOTSTRAP_SAMPLE = values
+
+
+def _bootstrap_block(seed: int, block: int, rows: int, studentized: bool, values=None):
+    """Draw one block of bootstrap resamples
+    
+    Each block has its own generator derived from (seed, block), so the
+    result of a block does not depend on which process computes it.
+    
+    Returns:
+        (resample means, resample standard errors or None)
+    """
+    x = _BOOTSTRAP_SAMPLE if values is None else values
+    n = len(x)
+    
+    if HAS_NUMPY and isinstance(x, np.ndarray):
+        rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(block,)))
+        idx = rng.integers(0, n, size=(rows, n), dtype=np.int32 if n < 2 ** 31 else np.int64)
+        sample = x[idx]
+        means = sample.mean(axis=1)
+        std_errors = sample.std(axis=1, ddof=1) / math.sqrt(n) if studentized else None
+        return means, std_errors
+    
+    rng = random.Random(seed * 1000003 + block)
+    means = []
+    std_errors = [] if studentized else None
+    for _ in range(rows):
+        sample = rng.choices(x, k=n)
+        mean = math.fsum(sample) / n
+        means.append(mean)
+        if studentized:
+            ss = math.fsum((v - mean) ** 2 for v in sample)
+            std_errors.append(math.sqrt(ss / (n - 1)) / math.sqrt(n))
+    return means, std_errors
+
+
+class BootstrapEngine:
+    """Batched bootstrap confidence intervals for the sample mean
+    
+    Resamples are drawn as index matrices of a bounded number of elements
+    per block (BLOCK_ELEMENTS), so memory does not grow with n_bootstrap,
+    and blocks can be spread over a process pool. The block layout depends
+    only on the sample size, so results are identical for any worker count.
+    Without NumPy the same blocks are drawn with the random module.
+    
+    Interval methods:
+    - percentile:   percentiles of the resampled means
+    - bca:          bias-corrected and accelerated (jackknife acceleration)
+    - percentile-t: studentized bootstrap using each resample's std error
+    """
+    
+    # AdvancedStatistics.confidence_interval() method names -> engine methods
+    CI_METHODS = {
+        'bootstrap': 'percentile',
+        'percentile': 'percentile',
+        'bca': 'bca',
+        'percentile-t': 'percentile-t',
+    }
+    
+    # Resample matrix elements per block (4M int32 indices = 16 MB)
+    BLOCK_ELEMENTS = 1 << 22
+    
+    def __init__(self, n_bootstrap: int = 10000, seed: int = 42, workers: int = 1,
+                 block_elements: Optional[int] = None):
+        """
+        Args:
+            n_bootstrap: Number of bootstrap resamples
+            seed: Base seed for reproducible results
+            workers: Worker processes (1 = in-process, 0 or None = all CPUs)
+            block_elements: Override BLOCK_ELEMENTS
+        """
+        if n_bootstrap < 1:
+            raise ValueError("n_bootstrap must be at least 1")
+        self.n_bootstrap = n_bootstrap
+        self.seed = seed
+        self.workers = workers if workers else (os.cpu_count() or 1)
+        self.block_elements = block_elements or self.BLOCK_ELEMENTS
+    
+    def resample(self, values, studentized: bool = False):
+        """Compute the bootstrap distribution of the mean
+        
+        Returns:
+            (means, std_errors) as NumPy arrays (lists without NumPy);
+            std_errors is None unless studentized
+        """
+        x = np.asarray(values, dtype=np.float64) if HAS_NUMPY else list(values)
+        n = len(x)
+        rows = max(1, self.block_elements // n)
+        blocks = [(b, min(rows, self.n_bootstrap - b * rows))
+                  for b in range((self.n_bootstrap + rows - 1) // rows)]
+        
+        if self.workers <= 1 or len(blocks) == 1:
+            parts = [_bootstrap_block(self.seed, b, r, studentized, x) for b, r in blocks]
+        else:
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(blocks)),
+                                     initializer=_bootstrap_worker_init,
+                                     initargs=(x,)) as pool:
+                parts = list(pool.map(_bootstrap_block,
+                                      [self.seed] * len(blocks),
+                                      [b for b, _ in blocks],
+                                      [r for _, r in blocks],
+                                      [studentized] * len(blocks)))
+        
+        if HAS_NUMPY:
+            means = np.concatenate([m for m, _ in parts])
+            std_errors = np.concatenate([s for _, s in parts]) if studentized else None
+        else:
+            means = [v for m, _ in parts for v in m]
+            std_errors = [v for _, s in parts for v in s] if studentized else None
+        return means, std_errors
+    
+    def confidence_interval(self, values, confidence: float = 0.95,
+                            method: str = 'percentile') -> Tuple[float, float]:
+        """Bootstrap confidence interval for the mean
+        
+        Args:
+            values: Sample values
+            confidence: Confidence level
+            method: 'percentile', 'bca', or 'percentile-t'
+        
+        Returns:
+            Tuple of (lower_bound, upper_bound)
+        """
+        if method not in ('percentile', 'bca', 'percentile-t'):
+            raise ValueError(f"Unknown bootstrap CI method: {method}")
+        
+        n = len(values)
+        if n < 2:
+            mean_val = float(values[0]) if n else 0
+            return (mean_val, mean_val)
+        
+        alpha = 1 - confidence
+        means, std_errors = self.resample(values, studentized=(method == 'percentile-t'))
+        
+        if method == 'percentile':
+            means_sorted = np.sort(means) if HAS_NUMPY else sorted(means)
+            return (self._quantile(means_sorted, alpha / 2),
+                    self._quantile(means_sorted, 1 - alpha / 2))
+        
+        if HAS_NUMPY:
+            x = np.asarray(values, dtype=np.float64)
+            mean = float(x.mean())
+            dev = x - mean
+            ss = float(np.dot(dev, dev))
+            s3 = float(np.dot(dev * dev, dev))
+        else:
+            mean = math.fsum(values) / n
+            ss = math.fsum((v - mean) ** 2 for v in values)
+            s3 = math.fsum((v - mean) ** 3 for v in values)
+        
+        if method == 'percentile-t':
+            std_err = math.sqrt(ss / (n - 1)) / math.sqrt(n)
+            if HAS_NUMPY:
+                keep = std_errors > 0
+                t_stats = np.sort((means[keep] - mean) / std_errors[keep])
+            else:
+                t_stats = sorted((m - mean) / s for m, s in zip(means, std_errors) if s > 0)
+            if len(t_stats) == 0:
+                return (mean, mean)
+            return (mean - self._quantile(t_stats, 1 - alpha / 2) * std_err,
+                    mean - self._quantile(t_stats, alpha / 2) * std_err)
+        
+        # BCa: bias correction from the share of resamples below the estimate,
+        # acceleration from the jackknife (closed form for the mean)
+        normal = statistics.NormalDist()
+        below = int(np.count_nonzero(means < mean)) if HAS_NUMPY else sum(1 for m in means if m < mean)
+        b = len(means)
+        z0 = normal.inv_cdf(min(max(below / b, 1 / (b + 1)), b / (b + 1)))
+        accel = s3 / (6 * ss ** 1.5) if ss > 0 else 0.0
+        
+        bounds = []
+        for q in (alpha / 2, 1 - alpha / 2):
+            z = z0 + normal.inv_cdf(q)
+            bounds.append(normal.cdf(z0 + z / (1 - accel * z)))
+        means_sorted = np.sort(means) if HAS_NUMPY else sorted(means)
+        return (self._quantile(means_sorted, bounds[0]),
+                self._quantile(means_sorted, bounds[1]))
+    
+    @staticmethod
+    def _quantile(sorted_values, q: float) -> float:
+        """Order statistic at fraction q (same indexing as the original percentile CI)"""
+        b = len(sorted_values)
+        return float(sorted_values[min(max(int(b * q), 0), b - 1)])
+
+
+def _betacf(a: float, b: float, x: float) -> float:
+    """Continued fraction for the incomplete beta function (modified Lentz)"""
+    tiny = 1e-300
+    qab, qap, qam = a + b, a + 1.0, a - 1.0
+    c = 1.0
+    d = 1.0 - qab * x / qap
+    d = 1.0 / (d if abs(d) > tiny else tiny)
+    h = d
+    for m in range(1, 300):
+        m2 = 2 * m
+        aa = m * (b - m) * x / ((qam + m2) * (a + m2))
+        d = 1.0 + aa * d
+        d = 1.0 / (d if abs(d) > tiny else tiny)
+        c = 1.0 + aa / c
+        c = c if abs(c) > tiny else tiny
+        h *= d * c
+        aa = -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))
+        d = 1.0 + aa * d
+        d = 1.0 / (d if abs(d) > tiny else tiny)
+        c = 1.0 + aa / c
+        c = c if abs(c) > tiny else tiny
+        delta = d * c
+        h *= delta
+        if abs(delta - 1.0) < 1e-15:
+            break
+    return h
+
+
+def _betainc(a: float, b: float, x: float) -> float:
+    """Regularized incomplete beta function I_x(a, b)"""
+    if x <= 0.0:
+        return 0.0
+    if x >= 1.0:
+        return 1.0
+    log_front = (math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b) +
+                 a * math.log(x) + b * math.log1p(-x))
+    if x < (a + 1.0) / (a + b + 2.0):
+        return math.exp(log_front) * _betacf(a, b, x) / a
+    return 1.0 - math.exp(log_front) * _betacf(b, a, 1.0 - x) / b
+
+
+@lru_cache(maxsize=256)
+def _u_cdf(n1: int, n2: int) -> Tuple[float, ...]:
+    """Exact null CDF of the Mann-Whitney U statistic
+    
+    The number of arrangements with U = u is the coefficient of q^u in
+    the Gaussian binomial [n1 + n2 choose n1]_q, built up one factor
+    (1 - q^(n2+i)) / (1 - q^i) at a time with exact integer arithmetic.
+    """
+    if n1 > n2:
+        n1, n2 = n2, n1
+    size = n1 * n2 + 1
+    counts = [0] * size
+    counts[0] = 1
+    for i in range(1, n1 + 1):
+        # Multiply by (1 - q^(n2 + i))
+        shift = n2 + i
+        for u in range(size - 1, shift - 1, -1):
+            counts[u] -= counts[u - shift]
+        # Divide by (1 - q^i)
+        for u in range(i, size):
+            counts[u] += counts[u - i]
+    total = sum(counts)
+    cdf = []
+    running = 0
+    for count in counts:
+        running += count
+        cdf.append(running / total)
+    return tuple(cdf)
+
+
+class RankEngine:
+    """Tie-aware ranking and Mann-Whitney U null distributions
+    
+    Ranking is vectorized with NumPy when available. Exact U
+    distributions are cached per (n1, n2), so repeated comparisons of
+    equally sized samples cost one table lookup.
+    """
+    
+    # Largest group size for which the exact U distribution is used
+    EXACT_MAX_SIZE = 50
+    
+    @staticmethod
+    def rank(values) -> Tuple[List[float], List[int]]:
+        """Rank values, averaging ranks across ties
+        
+        Args:
+            values: Sequence of values
+        
+        Returns:
+            Tuple of (1-based ranks in input order, sizes of tie groups > 1)
+        """
+        n = len(values)
+        if n == 0:
+            return [], []
+        
+        if HAS_NUMPY:
+            x = np.asarray(values, dtype=np.float64)
+            order = np.argsort(x, kind='mergesort')
+            xs = x[order]
+            starts = np.concatenate(([0], np.flatnonzero(xs[1:] != xs[:-1]) + 1))
+            ends = np.append(starts[1:], n)
+            sizes = ends - starts
+            ranks = np.empty(n, dtype=np.float64)
+            ranks[order] = np.repeat((starts + ends + 1) / 2.0, sizes)
+            return ranks.tolist(), sizes[sizes > 1].tolist()
+        
+        order = sorted(range(n), key=values.__getitem__)
+        ranks = [0.0] * n
+        tie_sizes = []
+        i = 0
+        while i < n:
+            j = i + 1
+            value = values[order[i]]
+            while j < n and values[order[j]] == value:
+                j += 1
+            avg_rank = (i + j + 1) / 2
+            for k in order[i:j]:
+                ranks[k] = avg_rank
+            if j - i > 1:
+                tie_sizes.append(j - i)
+            i = j
+        return ranks, tie_sizes
+    
+    @staticmethod
+    def exact_p_value(u: float, n1: int, n2: int) -> float:
+        """Exact two-tailed p-value for U (no ties)
+        
+        Args:
+            u: U statistic (either tail)
+            n1: Size of first sample
+            n2: Size of second sample
+        
+        Returns:
+            Two-tailed p-value
+        """
+        u_min = min(u, n1 * n2 - u)
+        cdf = _u_cdf(n1, n2)
+        return min(1.0, 2.0 * cdf[int(math.floor(u_min + 1e-9))])
+    
+    @staticmethod
+    def normal_p_value(u: float, n1: int, n2: int,
+                       tie_sizes: Optional[List[int]] = None) -> float:
+        """Two-tailed p-value for U from the tie-corrected normal approximation
+        
+        Args:
+            u: U statistic (either tail)
+            n1: Size of first sample
+            n2: Size of second sample
+            tie_sizes: Sizes of tie groups in the pooled sample
+        
+        Returns:
+            Two-tailed p-value
+        """
+        n = n1 + n2
+        tie_term = sum(t ** 3 - t for t in tie_sizes or ())
+        variance = n1 * n2 / 12.0 * ((n + 1) - (tie_term / (n * (n - 1)) if n > 1 else 0.0))
+        if variance <= 0:
+            return 1.0
+        mean_u = n1 * n2 / 2.0
+        z = max(abs(u - mean_u) - 0.5, 0.0) / math.sqrt(variance)
+        return AdvancedStatistics._z_to_p_value(z)
+
+
+class QuantileSketch:
+    """Mergeable quantile sketch with relative-error guarantees (DDSketch)
+    
+    Values are counted in logarithmic buckets: bucket i holds values in
+    (gamma^(i-1), gamma^i] with gamma = (1 + a) / (1 - a), so every quantile
+    is returned within relative accuracy a of a true sample value. Memory is
+    bounded by max_buckets; when exceeded, the lowest buckets are collapsed,
+    which only degrades the lowest quantiles. Two sketches with the same
+    accuracy merge exactly by adding bucket counts.
+    
+    Quantiles use the same order-statistic convention as
+    AdvancedStatistics (sorted[int(n * q)]).
+    """
+    
+    # Magnitudes below this are counted as zero
+    MIN_MAGNITUDE = 1e-9
+    
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.positive: Dict[int, int] = {}
+        self.negative: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+    
+    def _key(self, magnitude: float) -> int:
+        return math.ceil(math.log(magnitude) / self._log_gamma)
+    
+    def _value(self, key: int) -> float:
+        return 2 * self.gamma ** key / (self.gamma + 1)
+    
+    def add(self, value: float, count: int = 1):
+        """Add a value (count times)"""
+        if value > self.MIN_MAGNITUDE:
+            store = self.positive
+            key = self._key(value)
+        elif value < -self.MIN_MAGNITUDE:
+            store = self.negative
+            key = self._key(-value)
+        else:
+            store = None
+        
+        if store is None:
+            self.zero_count += count
+        else:
+            store[key] = store.get(key, 0) + count
+            if len(store) > self.max_buckets:
+                self._collapse(store)
+        
+        self.count += count
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+    
+    def update(self, values):
+        """Add many values (vectorized when NumPy is available)"""
+        if not HAS_NUMPY:
+            for value in values:
+                self.add(value)
+            return
+        
+        x = np.asarray(values, dtype=np.float64)
+        if x.size == 0:
+            return
+        for store, magnitudes in ((self.positive, x[x > self.MIN_MAGNITUDE]),
+                                  (self.negative, -x[x < -self.MIN_MAGNITUDE])):
+            if magnitudes.size:
+                keys, counts = np.unique(np.ceil(np.log(magnitudes) / self._log_gamma).astype(np.int64),
+                                         return_counts=True)
+                for key, count in zip(keys.tolist(), counts.tolist()):
+                    store[key] = store.get(key, 0) + count
+                if len(store) > self.max_buckets:
+                    self._collapse(store)
+        self.zero_count += int(np.count_nonzero(np.abs(x) <= self.MIN_MAGNITUDE))
+        self.count += int(x.size)
+        self.min = min(self.min, float(x.min()))
+        self.max = max(self.max, float(x.max()))
+    
+    def _collapse(self, store: Dict[int, int]):
+        """Fold the buckets nearest the low end of the distribution together"""
+        keys = sorted(store)
+        # For negative values a larger key is a lower value
+        if store is self.negative:
+            keys.reverse()
+        excess = len(keys) - self.max_buckets
+        target = keys[excess]
+        for key in keys[:excess]:
+            store[target] += store.pop(key)
+    
+    def merge(self, other: 'QuantileSketch'):
+        """Merge another sketch into this one (in place)"""
+        if not math.isclose(self.gamma, other.gamma):
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        for store, other_store in ((self.positive, other.positive),
+                                   (self.negative, other.negative)):
+            for key, count in other_store.items():
+                store[key] = store.get(key, 0) + count
+            if len(store) > self.max_buckets:
+                self._collapse(store)
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+    
+    def _buckets(self):
+        """Yield (representative value, count) in ascending value order"""
+        for key in sorted(self.negative, reverse=True):
+            yield -self._value(key), self.negative[key]
+        if self.zero_count:
+            yield 0.0, self.zero_count
+        for key in sorted(self.positive):
+            yield self._value(key), self.positive[key]
+    
+    def quantile(self, q: float) -> float:
+        """Approximate value at quantile q (0.0 to 1.0)"""
+        if self.count == 0:
+            return 0.0
+        rank = min(int(self.count * q), self.count - 1)
+        seen = 0
+        for value, count in self._buckets():
+            seen += count
+            if seen > rank:
+                return min(max(value, self.min), self.max)
+        return self.max
+    
+    def count_below(self, threshold: float) -> int:
+        """Approximate number of values below threshold"""
+        below = 0
+        for value, count in self._buckets():
+            if value >= threshold:
+                break
+            below += count
+        return below
+    
+    def count_above(self, threshold: float) -> int:
+        """Approximate number of values above threshold"""
+        above = 0
+        for value, count in self._buckets():
+            if value > threshold:
+                above += count
+        return above
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to a JSON-compatible dictionary"""
+        return {
+            'relative_accuracy': self.relative_accuracy,
+            'max_buckets': self.max_buckets,
+            'positive': sorted([k, c] for k, c in self.positive.items()),
+            'negative': sorted([k, c] for k, c in self.negative.items()),
+            'zero_count': self.zero_count,
+            'count': self.count,
+            'min': self.min if self.count else None,
+            'max': self.max if self.count else None,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'QuantileSketch':
+        """Rebuild a sketch serialized with to_dict()"""
+        sketch = cls(data['relative_accuracy'], data.get('max_buckets', 2048))
+        sketch.positive = {int(k): int(c) for k, c in data.get('positive', [])}
+        sketch.negative = {int(k): int(c) for k, c in data.get('negative', [])}
+        sketch.zero_count = int(data.get('zero_count', 0))
+        sketch.count = int(data.get('count', 0))
+        if sketch.count:
+            sketch.min = float(data['min'])
+            sketch.max = float(data['max'])
+        return sketch
+
+
+class ChangePointDetector:
+    """Change-point detection for ordered series (e.g. interim results)
+    
+    Binary segmentation with a Gaussian mean-shift cost: a segment is
+    split at the point that most reduces the sum of squared deviations,
+    as long as the reduction exceeds a penalty. Segment costs come from
+    prefix sums, so each level costs O(n) and the whole search
+    O(n log n); with NumPy every split search is one vector operation.
+    """
+    
+    def __init__(self, penalty: Optional[float] = None, min_size: int = 2):
+        """Initialize detector
+        
+        Args:
+            penalty: Penalty per change point in units of the noise
+                variance (None = BIC-style 2 * ln(n))
+            min_size: Minimum number of samples per segment
+        """
+        self.penalty = penalty
+        self.min_size = max(1, int(min_size))
+    
+    @staticmethod
+    def noise_variance(values) -> float:
+        """Robust noise variance estimate from first differences
+        
+        The median absolute deviation of successive differences is
+        insensitive to the level shifts being searched for.
+        """
+        diffs = [b - a for a, b in zip(values, values[1:])]
+        if not diffs:
+            return 0.0
+        center = statistics.median(diffs)
+        mad = statistics.median([abs(d - center) for d in diffs])
+        sigma = 1.4826 * mad / math.sqrt(2.0)
+        if sigma == 0 and len(diffs) > 1:
+            # Quantized series: fall back to the plain spread of differences
+            sigma = statistics.stdev(diffs) / math.sqrt(2.0)
+        return sigma * sigma
+    
+    def detect(self, values) -> List[int]:
+        """Find change points
+        
+        Args:
+            values: Ordered samples
+        
+        Returns:
+            Sorted indices where a new segment starts (excluding 0)
+        """
+        n = len(values)
+        min_size = self.min_size
+        if n < 2 * min_size:
+            return []
+        
+        variance = self.noise_variance(values)
+        if variance == 0:
+            return []
+        beta = self.penalty if self.penalty is not None else 2.0 * math.log(n)
+        pen = beta * variance
+        
+        csum = [0.0] * (n + 1)
+        csum2 = [0.0] * (n + 1)
+        for i, x in enumerate(values):
+            csum[i + 1] = csum[i] + x
+            csum2[i + 1] = csum2[i] + x * x
+        if HAS_NUMPY:
+            csum = np.asarray(csum)
+            csum2 = np.asarray(csum2)
+        
+        def cost(s, t):
+            seg_sum = csum[t] - csum[s]
+            return (csum2[t] - csum2[s]) - seg_sum * seg_sum / (t - s)
+        
+        points = []
+        pending = [(0, n)]
+        while pending:
+            start, end = pending.pop()
+            if end - start < 2 * min_size:
+                continue
+            total = cost(start, end)
+            if HAS_NUMPY:
+                splits = np.arange(start + min_size, end - min_size + 1)
+                gains = total - cost(start, splits) - cost(splits, end)
+                k = int(np.argmax(gains))
+                split, gain = int(splits[k]), float(gains[k])
+            else:
+                gain, split = max((total - cost(start, k) - cost(k, end), k)
+                                  for k in range(start + min_size, end - min_size + 1))
+            if gain > pen:
+                points.append(split)
+                pending.append((start, split))
+                pending.append((split, end))
+        return sorted(points)
+    
+    def segment(self, values, timestamps: Optional[List[float]] = None) -> Dict[str, Any]:
+        """Split a series into stable segments
+        
+        Args:
+            values: Ordered samples
+            timestamps: Optional per-sample timestamps (e.g. interim end times)
+        
+        Returns:
+            Dictionary with change points, per-segment statistics and the
+            steady-state window (the longest segment, latest on ties)
+        """
+        values = [float(v) for v in values]
+        points = self.detect(values)
+        bounds = [0] + points + [len(values)]
+        
+        segments = []
+        for start, end in zip(bounds, bounds[1:]):
+            if end <= start:
+                continue
+            window = values[start:end]
+            mean = statistics.fmean(window)
+            stddev = statistics.stdev(window) if len(window) > 1 else 0.0
+            seg = {
+                'start': start,
+                'end': end,
+                'count': end - start,
+                'mean': mean,
+                'median': statistics.median(window),
+                'stddev': stddev,
+                'min': min(window),
+                'max': max(window),
+                'coefficient_of_variation': (stddev / mean * 100) if mean != 0 else 0.0,
+            }
+            if timestamps is not None:
+                seg['start_time'] = timestamps[start]
+                seg['end_time'] = timestamps[end - 1]
+            segments.append(seg)
+        
+        steady = None
+        for seg in segments:
+            if steady is None or seg['count'] >= steady['count']:
+                steady = seg
+        
+        return {
+            'count': len(values),
+            'change_points': points,
+            'segments': segments,
+            'steady_state': steady,
+        }
+
+
+class SteadyStateDetector:
+    """Online warmup detection for interim-result series
+    
+    Samples are added as they arrive. 'mser5' applies the MSER-5 rule
+    (White, 1997): the truncation point minimises the standard error of
+    the remaining 5-sample batch means, and is accepted once it falls in
+    the first half of the run. 'cv' declares steady state at the first
+    rolling window whose coefficient of variation drops below a threshold.
+    """
+    
+    METHODS = ('mser5', 'cv')
+    
+    def __init__(self, method: str = 'mser5', batch_size: int = 5, min_samples: int = 20,
+                 window: int = 10, cv_threshold: float = 2.0):
+        """Initialize detector
+        
+        Args:
+            method: 'mser5' or 'cv'
+            batch_size: Batch size for MSER (5 for MSER-5)
+            min_samples: Samples required before MSER may declare steady state
+            window: Rolling window length for the 'cv' rule
+            cv_threshold: Coefficient of variation (%) for the 'cv' rule
+        """
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown steady-state method: {method}")
+        self.method = method
+        self.batch_size = max(1, int(batch_size))
+        self.min_samples = max(2 * self.batch_size, int(min_samples))
+        self.window = max(2, int(window))
+        self.cv_threshold = cv_threshold
+        self.values = []
+        self._batch_means = []
+        self._truncation = None
+    
+    @property
+    def count(self) -> int:
+        return len(self.values)
+    
+    @property
+    def is_steady(self) -> bool:
+        return self._truncation is not None
+    
+    def add(self, value: float) -> bool:
+        """Add one sample; returns True once steady state has been reached"""
+        self.values.append(float(value))
+        n = len(self.values)
+        
+        if self.method == 'cv':
+            if self._truncation is None and n >= self.window:
+                window = self.values[-self.window:]
+                mean = statistics.fmean(window)
+                if mean != 0 and statistics.stdev(window) / abs(mean) * 100 < self.cv_threshold:
+                    self._truncation = n - self.window
+            return self.is_steady
+        
+        if n % self.batch_size == 0:
+            self._batch_means.append(statistics.fmean(self.values[-self.batch_size:]))
+            if n >= self.min_samples:
+                self._truncation = self._mser_truncation()
+        return self.is_steady
+    
+    def update(self, values) -> bool:
+        """Add several samples"""
+        for value in values:
+            self.add(value)
+        return self.is_steady
+    
+    def _mser_truncation(self) -> Optional[int]:
+        """MSER truncation point in samples, or None if the run is too short"""
+        means = self._batch_means
+        m = len(means)
+        half = m // 2
+        # Suffix sums of the batch means give every candidate in O(m);
+        # only the first half is searched, and a minimum on its boundary
+        # means the series is still drifting
+        best_d, best_score = None, math.inf
+        s1 = s2 = 0.0
+        for d in range(m - 1, -1, -1):
+            s1 += means[d]
+            s2 += means[d] * means[d]
+            if d > half:
+                continue
+            k = m - d
+            score = max(s2 - s1 * s1 / k, 0.0) / (k * k)
+            if score <= best_score:
+                best_d, best_score = d, score
+        if best_d is None or (best_d == half and best_score > 0):
+            return None
+        return best_d * self.batch_size
+    
+    def truncation_point(self) -> Optional[int]:
+        """Index of the first steady-state sample (None if not steady yet)"""
+        return self._truncation
+    
+    def steady_values(self) -> List[float]:
+        """Samples after the warmup period (all samples if not steady)"""
+        return self.values[self._truncation or 0:]
+    
+    def summary(self, confidence_level: float = 0.95) -> Dict[str, Any]:
+        """Statistics over the steady-state window
+        
+        The confidence interval is computed from batch means when the
+        window holds at least four batches, since successive interim
+        results are autocorrelated.
+        
+        Args:
+            confidence_level: Confidence level for the interval
+        
+        Returns:
+            Dictionary with warmup length and steady-window statistics
+        """
+        values = self.steady_values()
+        result = {
+            'method': self.method,
+            'steady': self.is_steady,
+            'warmup_samples': self._truncation if self._truncation is not None else 0,
+            'count': len(values),
+        }
+        if not values:
+            return result
+        
+        mean = statistics.fmean(values)
+        stddev = statistics.stdev(values) if len(values) > 1 else 0.0
+        b = self.batch_size
+        batches = [statistics.fmean(values[i:i + b]) for i in range(0, len(values) - b + 1, b)]
+        ci_lower, ci_upper = AdvancedStatistics.confidence_interval(
+            batches if len(batches) >= 4 else values, confidence_level, method='t-dist')
+        margin = (ci_upper - ci_lower) / 2
+        result.update({
+            'mean': mean,
+            'median': statistics.median(values),
+            'stddev': stddev,
+            'coefficient_of_variation': (stddev / mean * 100) if mean != 0 else 0.0,
+            'ci_lower': mean - margin,
+            'ci_upper': mean + margin,
+            'ci_margin': margin,
+            'relative_ci_margin': abs(margin / mean) if mean != 0 else math.inf,
+        })
+        return result
+    
+    def confidence_met(self, target_relative_margin: float, confidence_level: float = 0.95) -> bool:
+        """Whether the steady window's CI half-width is within a fraction of the mean
+        
+        Args:
+            target_relative_margin: e.g. 0.01 for a ±1% interval
+            confidence_level: Confidence level for the interval
+        """
+        if not self.is_steady:
+            return False
+        summary = self.summary(confidence_level)
+        return summary['count'] >= 2 and summary['relative_ci_margin'] <= target_relative_margin
+
+
+class StreamingStatistics:
+    """One-pass, constant-memory statistics accumulator
+    
+    Tracks count, mean and the second to fourth central moments with
+    Welford/Terriberry updates, plus a QuantileSketch for percentiles and
+    IQR fences. Accumulators merge exactly (Pebay's pairwise formulas for
+    the moments), so partial results from separate streams can be combined.
+    """
+    
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.m3 = 0.0
+        self.m4 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.sketch = QuantileSketch(relative_accuracy, max_buckets)
+    
+    def add(self, value: float):
+        """Add a single value"""
+        n1 = self.count
+        self.count += 1
+        n = self.count
+        delta = value - self.mean
+        delta_n = delta / n
+        delta_n2 = delta_n * delta_n
+        term1 = delta * delta_n * n1
+        self.mean += delta_n
+        self.m4 += term1 * delta_n2 * (n * n - 3 * n + 3) + 6 * delta_n2 * self.m2 - 4 * delta_n * self.m3
+        self.m3 += term1 * delta_n * (n - 2) - 3 * delta_n * self.m2
+        self.m2 += term1
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.sketch.add(value)
+    
+    def update(self, values):
+        """Add many values
+        
+        With NumPy the chunk's moments are computed as arrays and merged in,
+        which is much faster than per-value updates for large chunks.
+        """
+        if not HAS_NUMPY:
+            for value in values:
+                self.add(value)
+            return
+        
+        x = np.asarray(values, dtype=np.float64)
+        if x.size == 0:
+            return
+        mean = float(x.mean())
+        dev = x - mean
+        sq = dev * dev
+        self._merge_moments(int(x.size), mean, float(sq.sum()), float(np.dot(sq, dev)),
+                            float(np.dot(sq, sq)), float(x.min()), float(x.max()))
+        self.sketch.update(x)
+    
+    def merge(self, other: 'StreamingStatistics'):
+        """Merge another accumulator into this one (in place)"""
+        self._merge_moments(other.count, other.mean, other.m2, other.m3, other.m4,
+                            other.min, other.max)
+        self.sketch.merge(other.sketch)
+    
+    def _merge_moments(self, nb: int, mean_b: float, m2b: float, m3b: float, m4b: float,
+                       min_b: float, max_b: float):
+        """Combine the moments of another partition into this one (Pebay 2008)"""
+        na = self.count
+        if nb == 0:
+            return
+        if na == 0:
+            self.count, self.mean = nb, mean_b
+            self.m2, self.m3, self.m4 = m2b, m3b, m4b
+            self.min, self.max = min_b, max_b
+            return
+        
+        n = na + nb
+        delta = mean_b - self.mean
+        delta2 = delta * delta
+        m2a, m3a = self.m2, self.m3
+        
+        self.m4 += (m4b + delta2 * delta2 * na * nb * (na * na - na * nb + nb * nb) / n ** 3
+                    + 6 * delta2 * (na * na * m2b + nb * nb * m2a) / n ** 2
+                    + 4 * delta * (na * m3b - nb * m3a) / n)
+        self.m3 += (m3b + delta2 * delta * na * nb * (na - nb) / n ** 2
+                    + 3 * delta * (na * m2b - nb * m2a) / n)
+        self.m2 += m2b + delta2 * na * nb / n
+        self.mean += delta * nb / n
+        self.count = n
+        self.min = min(self.min, min_b)
+        self.max = max(self.max, max_b)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to a JSON-compatible dictionary
+        
+        The result is a few kilobytes at most regardless of how many values
+        were added, so instances and hosts can ship it instead of samples.
+        """
+        return {
+            'format': 'netperf-streaming-stats',
+            'version': 1,
+            'count': self.count,
+            'mean': self.mean,
+            'm2': self.m2,
+            'm3': self.m3,
+            'm4': self.m4,
+            'min': self.min if self.count else None,
+            'max': self.max if self.count else None,
+            'sketch': self.sketch.to_dict(),
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'StreamingStatistics':
+        """Rebuild an accumulator serialized with to_dict()"""
+        if data.get('format') != 'netperf-streaming-stats':
+            raise ValueError("Not a netperf streaming statistics summary")
+        acc = cls()
+        acc.sketch = QuantileSketch.from_dict(data['sketch'])
+        acc.count = int(data['count'])
+        acc.mean = float(data['mean'])
+        acc.m2 = float(data['m2'])
+        acc.m3 = float(data['m3'])
+        acc.m4 = float(data['m4'])
+        if acc.count:
+            acc.min = float(data['min'])
+            acc.max = float(data['max'])
+        return acc
+    
+    @classmethod
+    def merged(cls, summaries) -> 'StreamingStatistics':
+        """Merge accumulators (or their to_dict() forms) into a new one"""
+        total = None
+        for summary in summaries:
+            if isinstance(summary, dict):
+                summary = cls.from_dict(summary)
+            if total is None:
+                total = cls(summary.sketch.relative_accuracy, summary.sketch.max_buckets)
+            total.merge(summary)
+        return total if total is not None else cls()
+    
+    def variance(self) -> float:
+        """Sample variance"""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+    
+    def stddev(self) -> float:
+        """Sample standard deviation"""
+        return math.sqrt(max(self.variance(), 0.0))
+    
+    def percentile(self, p: float) -> float:
+        """Approximate percentile (0-100)"""
+        return self.sketch.quantile(p / 100.0)
+    
+    def summary(self, confidence_level: float = 0.95, iqr_factor: float = 1.5) -> Dict[str, Any]:
+        """Statistics in the shape of AdvancedStatistics.calculate_comprehensive_stats()
+        
+        Percentiles, median, quartiles and outlier counts are sketch
+        estimates; the confidence interval always uses the t-distribution.
+        
+        Returns:
+            Dictionary of statistics (empty if no values were added)
+        """
+        n = self.count
+        if n == 0:
+            return {}
+        
+        mean = self.mean
+        stddev = self.stddev()
+        stats = {
+            'count': n,
+            'mean': mean,
+            'median': self.sketch.quantile(0.50),
+            'min': self.min,
+            'max': self.max,
+            'range': self.max - self.min,
+            'stddev': stddev,
+            'variance': self.variance(),
+            'coefficient_of_variation': (stddev / mean * 100) if n >= 2 and mean != 0 else 0,
+            'std_error': stddev / math.sqrt(n) if n >= 2 else 0,
+            'p50': self.sketch.quantile(0.50),
+            'p90': self.sketch.quantile(0.90),
+            'p95': self.sketch.quantile(0.95),
+            'p99': self.sketch.quantile(0.99),
+            'quantile_relative_accuracy': self.sketch.relative_accuracy,
+        }
+        
+        if n >= 2:
+            margin = AdvancedStatistics._t_critical(n - 1, confidence_level) * stats['std_error']
+            stats['ci_lower'] = mean - margin
+            stats['ci_upper'] = mean + margin
+            stats['ci_margin'] = margin
+            stats['ci_level'] = confidence_level
+            stats['ci_range'] = 2 * margin
+        
+        if n >= 4:
+            q1 = self.sketch.quantile(0.25)
+            q3 = self.sketch.quantile(0.75)
+            iqr = q3 - q1
+            stats['q1'] = q1
+            stats['q3'] = q3
+            stats['iqr'] = iqr
+            stats['lower_fence'] = q1 - iqr_factor * iqr
+            stats['upper_fence'] = q3 + iqr_factor * iqr
+            stats['outlier_count'] = (self.sketch.count_below(stats['lower_fence']) +
+                                      self.sketch.count_above(stats['upper_fence']))
+            stats['outlier_percentage'] = stats['outlier_count'] / n * 100
+        
+        if n >= 3:
+            if stddev == 0:
+                stats['skewness'] = 0
+                stats['kurtosis'] = 0
+                stats['skewness_interpretation'] = 'no variation'
+                stats['kurtosis_interpretation'] = 'no variation'
+            else:
+                # Same definitions as analyze_distribution()
+                skewness = (self.m3 / n) / stddev ** 3
+                kurtosis = (self.m4 / n) / stddev ** 4 - 3
+                stats['skewness'] = skewness
+                stats['kurtosis'] = kurtosis
+                stats['skewness_interpretation'] = AdvancedStatistics._interpret_skewness(skewness)
+                stats['kurtosis_interpretation'] = AdvancedStatistics._interpret_kurtosis(kurtosis)
+        
+        return stats
+
+
+def parse_interim_line(line: str) -> Optional[Tuple[float, Optional[float]]]:
+    """Extract a sample and its timestamp from one input line
+    
+    Accepts a bare number or a netperf --demo-mode result in any output
+    format: human ("Interim result: 9473.56 10^6bits/s over 1.000 seconds
+    ending at <epoch>"), CSV ("9473.56,10^6bits/s,1.000,<epoch>") or the
+    first keyval line ("NETPERF_INTERIM_RESULT[0]=9473.56", no timestamp;
+    use InterimParser to pair it with NETPERF_ENDING).
+    
+    Returns:
+        (value, end timestamp or None), or None if the line holds no sample
+    """
+    line = line.strip()
+    if not line:
+        return None
+    timestamp = None
+    if line.startswith('Interim result:'):
+        fields = line.split()
+        line = fields[2] if len(fields) > 2 else ''
+        if len(fields) > 9:
+            try:
+                timestamp = float(fields[9])
+            except ValueError:
+                pass
+    elif line.startswith('NETPERF_INTERIM_RESULT'):
+        line = line.partition('=')[2]
+    elif line.count(',') == 3:
+        fields = line.split(',')
+        if not fields[1].strip().endswith('/s'):
+            return None
+        line = fields[0]
+        try:
+            timestamp = float(fields[3])
+        except ValueError:
+            pass
+    try:
+        return float(line), timestamp
+    except ValueError:
+        return None
+
+
+class InterimParser:
+    """Collect netperf --demo-mode (-D) results from output in any format
+    
+    Human and CSV interim results are one line each; keyval results span
+    NETPERF_INTERIM_RESULT/UNITS/INTERVAL/ENDING[n] lines, so the parser
+    keeps the pending result between calls. (netperf cannot combine -D
+    with JSON output: it exits on the first interim result.)
+    """
+    
+    KEYVAL_PREFIXES = ('NETPERF_INTERIM_RESULT[', 'NETPERF_UNITS[',
+                       'NETPERF_INTERVAL[', 'NETPERF_ENDING[')
+    
+    def __init__(self):
+        self._pending = {}
+    
+    @classmethod
+    def is_interim_line(cls, line: str) -> bool:
+        """True if the line is (part of) an interim result"""
+        line = line.strip()
+        return (line.startswith('Interim result:') or line.startswith(cls.KEYVAL_PREFIXES)
+                or (line.count(',') == 3 and line.split(',')[1].strip().endswith('/s')))
+    
+    def feed(self, line: str) -> Optional[Tuple[float, float, float]]:
+        """Parse one output line
+        
+        Returns:
+            (value, interval seconds, end timestamp) once a whole interim
+            result has been read, else None
+        """
+        line = line.strip()
+        try:
+            if line.startswith('Interim result:'):
+                fields = line.split()
+                return float(fields[2]), float(fields[5]), float(fields[9])
+            if line.startswith(self.KEYVAL_PREFIXES):
+                key, _, value = line.partition('=')
+                name = key.split('[', 1)[0]
+                if name == 'NETPERF_INTERIM_RESULT':
+                    self._pending = {'value': float(value)}
+                elif name == 'NETPERF_INTERVAL':
+                    self._pending['interval'] = float(value)
+                elif name == 'NETPERF_ENDING' and 'value' in self._pending:
+                    pending, self._pending = self._pending, {}
+                    return pending['value'], pending.get('interval', 1.0), float(value)
+                return None
+            if line.count(',') == 3:
+                fields = line.split(',')
+                if fields[1].strip().endswith('/s'):
+                    return float(fields[0]), float(fields[2]), float(fields[3])
+        except (IndexError, ValueError):
+            pass
+        return None
+
+
+def parse_interim_output(output: str) -> List[Tuple[float, float, float]]:
+    """All interim results in netperf output
+    
+    Returns:
+        [(value, interval seconds, end timestamp), ...]
+    """
+    parser = InterimParser()
+    results = []
+    for line in output.splitlines():
+        result = parser.feed(line)
+        if result is not None:
+            results.append(result)
+    return results
+
+
+def parse_sample_line(line: str) -> Optional[float]:
+    """Extract a sample from one input line
+    
+    Accepts a bare number or a netperf --demo-mode line in human, CSV or
+    keyval form (see parse_interim_line).
+    
+    Returns:
+        The value, or None if the line holds no sample
+    """
+    sample = parse_interim_line(line)
+    return sample[0] if sample else None
+
+
+def run_and_summarize(command: List[str]) -> int:
+    """Run a netperf command, summarising its interim results as they arrive
+    
+    Other output is passed through unchanged; the interim results are
+    replaced by one NETPERF_INTERIM_SUMMARY=<json> line holding a mergeable
+    StreamingStatistics summary, so a remote host returns a fixed-size
+    summary instead of every sample.
+    
+    Returns:
+        The command's exit status
+    """
+    import json
+    import subprocess
+    import sys
+    
+    try:
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    except OSError as e:
+        print(f"Error: cannot execute {command[0]}: {e.strerror}", file=sys.stderr)
+        return 127
+    
+    parser = InterimParser()
+    summary = StreamingStatistics()
+    chunk = []
+    for line in process.stdout:
+        if not InterimParser.is_interim_line(line):
+            sys.stdout.write(line)
+            continue
+        result = parser.feed(line)
+        if result is not None:
+            chunk.append(result[0])
+            if len(chunk) >= 4096:
+                summary.update(chunk)
+                chunk.clear()
+    summary.update(chunk)
+    
+    returncode = process.wait()
+    if summary.count:
+        print('NETPERF_INTERIM_SUMMARY=' + json.dumps(summary.to_dict(), separators=(',', ':')))
+    sys.stdout.flush()
+    return returncode
+
+
+def print_stream_summary(stats: Dict[str, Any], confidence: float):
+    """Print a StreamingStatistics summary in the CLI report layout"""
+    print("Statistics (streaming, percentiles within "
+          f"{stats['quantile_relative_accuracy'] * 100:.1f}%):")
+    print(f"  Count: {stats['count']}")
+    print(f"  Range: {stats['min']:.2f} to {stats['max']:.2f}")
+    if 'ci_margin' in stats:
+        print(f"  Mean: {stats['mean']:.2f} ± {stats['ci_margin']:.2f} ({int(confidence*100)}% CI)")
+    else:
+        print(f"  Mean: {stats['mean']:.2f}")
+    print(f"  Median: {stats['median']:.2f}")
+    print(f"  Std Dev: {stats['stddev']:.2f}")
+    print(f"  CV: {stats['coefficient_of_variation']:.2f}%")
+    print(f"  P90/P95/P99: {stats['p90']:.2f} / {stats['p95']:.2f} / {stats['p99']:.2f}")
+    if 'outlier_count' in stats:
+        print(f"  IQR fences: {stats['lower_fence']:.2f} to {stats['upper_fence']:.2f}")
+        print(f"  Outliers: ~{stats['outlier_count']} ({stats['outlier_percentage']:.1f}%)")
+    if 'skewness' in stats:
+        print(f"  Skewness: {stats['skewness']:.3f} ({stats['skewness_interpretation']})")
+        print(f"  Kurtosis: {stats['kurtosis']:.3f} ({stats['kurtosis_interpretation']})")
+
+
+BATCH_TESTS = ('mann-whitney', 't-test')
+
+
+def read_series(path: str) -> List[float]:
+    """Read a value file (one sample or demo-mode line per line)"""
+    values = []
+    with open(path, 'r') as f:
+        for line in f:
+            value = parse_sample_line(line)
+            if value is not None:
+                values.append(value)
+    return values
+
+
+def _compare_series(task: Tuple[str, Optional[str], Optional[str], str]) -> Dict[str, Any]:
+    """Compare one baseline/candidate series pair (process pool worker)"""
+    name, baseline_path, candidate_path, test = task
+    row = {
+        'name': name,
+        'test': test,
+        'baseline_n': 0,
+        'candidate_n': 0,
+        'baseline_mean': None,
+        'candidate_mean': None,
+        'change_percent': None,
+        'statistic': None,
+        'p_value': None,
+        'direction': None,
+    }
+    if baseline_path is None or candidate_path is None:
+        row['verdict'] = 'missing-baseline' if baseline_path is None else 'missing-candidate'
+        return row
+    
+    try:
+        baseline = read_series(baseline_path)
+        candidate = read_series(candidate_path)
+    except OSError as e:
+        row['verdict'] = 'error'
+        row['error'] = str(e)
+        return row
+    
+    row['baseline_n'] = len(baseline)
+    row['candidate_n'] = len(candidate)
+    if baseline:
+        row['baseline_mean'] = statistics.fmean(baseline)
+    if candidate:
+        row['candidate_mean'] = statistics.fmean(candidate)
+    if baseline and candidate and row['baseline_mean'] != 0:
+        row['change_percent'] = (row['candidate_mean'] - row['baseline_mean']) / abs(row['baseline_mean']) * 100
+    
+    # A failing series must not take the rest of the batch down with it
+    try:
+        if test == 't-test':
+            result = AdvancedStatistics.t_test(candidate, baseline, equal_var=False)
+            statistic = result['t_statistic']
+        else:
+            result = AdvancedStatistics.mann_whitney_u(candidate, baseline)
+            statistic = result['u_statistic']
+    except (ArithmeticError, ValueError) as e:
+        result = {'error': f"{type(e).__name__}: {e}"}
+    
+    if 'error' in result:
+        row['verdict'] = 'insufficient'
+        row['error'] = result['error']
+        return row
+    
+    # Direction of the shift as seen by the test: the mean difference for
+    # Welch, the rank sums for Mann-Whitney (which can differ from the means)
+    if test == 't-test':
+        shift = row['candidate_mean'] - row['baseline_mean']
+    else:
+        shift = result['u1'] - result['u2']
+    row['statistic'] = statistic
+    row['p_value'] = result['p_value']
+    row['direction'] = (shift > 0) - (shift < 0)
+    return row
+
+
+def compare_series_dirs(baseline_dir: str, candidate_dir: str, test: str = 'mann-whitney',
+                        alpha: float = 0.05, higher_is_better: bool = True,
+                        workers: int = 1) -> List[Dict[str, Any]]:
+    """Compare every per-test series in two directories
+    
+    Files are paired by name. Comparisons run on a process pool and the
+    resulting p-values are adjusted together with Benjamini-Hochberg, so
+    alpha bounds the false discovery rate across the whole batch.
+    
+    Args:
+        baseline_dir: Directory of baseline value files
+        candidate_dir: Directory of candidate value files
+        test: 'mann-whitney' or 't-test' (Welch)
+        alpha: False discovery rate
+        higher_is_better: Direction of improvement for the metric
+        workers: Worker processes (1 = in-process, 0 = all CPUs)
+    
+    Returns:
+        One verdict row per series name, sorted by name
+    """
+    if test not in BATCH_TESTS:
+        raise ValueError(f"Unknown test '{test}' (expected one of {', '.join(BATCH_TESTS)})")
+    
+    def list_series(directory):
+        return {entry.name: entry.path for entry in os.scandir(directory)
+                if entry.is_file() and not entry.name.startswith('.')}
+    
+    baseline_files = list_series(baseline_dir)
+    candidate_files = list_series(candidate_dir)
+    tasks = [(name, baseline_files.get(name), candidate_files.get(name), test)
+             for name in sorted(set(baseline_files) | set(candidate_files))]
+    
+    workers = workers if workers else (os.cpu_count() or 1)
+    if workers <= 1 or len(tasks) <= 1:
+        rows = [_compare_series(task) for task in tasks]
+    else:
+        workers = min(workers, len(tasks))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            rows = list(pool.map(_compare_series, tasks,
+                                 chunksize=max(1, len(tasks) // (workers * 4))))
+    
+    tested = [row for row in rows if row['p_value'] is not None]
+    q_values = AdvancedStatistics.benjamini_hochberg([row['p_value'] for row in tested])
+    for row, q_value in zip(tested, q_values):
+        row['q_value'] = q_value
+        row['significant'] = q_value < alpha
+        if not row['significant']:
+            row['verdict'] = 'unchanged'
+        elif row['direction'] == 0:
+            # Significant without a shift either way; no improvement or regression
+            row['verdict'] = 'changed'
+        elif (row['direction'] > 0) == higher_is_better:
+            row['verdict'] = 'improvement'
+        else:
+            row['verdict'] = 'regression'
+    for row in rows:
+        row.setdefault('q_value', None)
+        row.setdefault('significant', False)
+    return rows
+
+
+def print_batch_table(rows: List[Dict[str, Any]], alpha: float):
+    """Print batch comparison verdicts as a text table"""
+    def fmt(value, spec):
+        return format(value, spec) if value is not None else '-'
+    
+    print(f"{'Series':<32} {'Base N':>6} {'Cand N':>6} {'Change':>9} {'p':>9} {'q':>9}  Verdict")
+    print("-" * 90)
+    for row in rows:
+        change = fmt(row['change_percent'], '+.2f') + ('%' if row['change_percent'] is not None else '')
+        print(f"{row['name'][:32]:<32} {row['baseline_n']:>6} {row['candidate_n']:>6} {change:>9} "
+              f"{fmt(row['p_value'], '.2e'):>9} {fmt(row['q_value'], '.2e'):>9}  {row['verdict']}")
+    
+    counts = {}
+    for row in rows:
+        counts[row['verdict']] = counts.get(row['verdict'], 0) + 1
+    print(f"\n{len(rows)} series (FDR {alpha}): " +
+          ", ".join(f"{count} {verdict}" for verdict, count in sorted(counts.items())))
+
+
 # CLI interface
 if __name__ == "__main__":
     import sys
+    import json
     import argparse
     
     parser = argparse.ArgumentParser(description='Netperf Statistics Analysis')
@@ -881,30 +2630,204 @@ if __name__ == "__main__":
     parser.add_argument('--no-hist', action='store_true', help='Disable histogram')
     parser.add_argument('--no-boxplot', action='store_true', help='Disable box plot')
     parser.add_argument('--bins', type=int, default=10, help='Number of histogram bins')
+    parser.add_argument('--backend', choices=['auto', 'numpy', 'python'], default='auto',
+                        help='Computation backend (default: auto, NumPy for large samples if installed)')
+    parser.add_argument('--ci-method', choices=['auto', 't-dist', 'bootstrap', 'bca', 'percentile-t'],
+                        default='auto',
+                        help='Confidence interval method (default: auto, t-dist below 30 samples, '
+                             'bootstrap from 30 on, with fewer resamples above 10^4 values)')
+    parser.add_argument('--bootstrap-samples', type=int, default=10000,
+                        help='Bootstrap resamples for bootstrap CI methods (default: 10000; '
+                             'with --ci-method auto at most 10^8 / n, but at least 1000)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Worker processes for bootstrap resampling (0 = all CPUs, default: 1)')
+    parser.add_argument('--stream', action='store_true',
+                        help='One-pass constant-memory mode (approximate percentiles, no plots)')
+    parser.add_argument('--report-every', type=int, default=0, metavar='N',
+                        help='In --stream mode, print a summary every N values')
+    parser.add_argument('--summary-json', metavar='FILE',
+                        help='In --stream mode, write the mergeable summary as JSON (- for stdout only)')
+    parser.add_argument('--merge', nargs='+', metavar='SUMMARY',
+                        help='Merge summary files written with --summary-json and report the result')
+    parser.add_argument('--batch', nargs=2, metavar=('BASELINE_DIR', 'CANDIDATE_DIR'),
+                        help='Compare every series file in two directories (paired by file name)')
+    parser.add_argument('--test', choices=BATCH_TESTS, default='mann-whitney',
+                        help='In --batch mode, significance test (default: mann-whitney)')
+    parser.add_argument('--fdr', type=float, default=0.05,
+                        help='In --batch mode, false discovery rate (default: 0.05)')
+    parser.add_argument('--lower-is-better', action='store_true',
+                        help='In --batch mode, treat decreases as improvements (e.g. latency)')
+    parser.add_argument('--segments', action='store_true',
+                        help='Treat input as an ordered series and report change points and segments')
+    parser.add_argument('--penalty', type=float, default=None,
+                        help='In --segments mode, change-point penalty (default: 2 ln n)')
+    parser.add_argument('--min-segment', type=int, default=3,
+                        help='In --segments mode, minimum samples per segment (default: 3)')
+    parser.add_argument('--output', metavar='FILE',
+                        help='In --batch mode, write the verdict table as JSON or CSV (by extension, - for JSON on stdout); '
+                             'in --segments mode, write the segments as JSON')
+    parser.add_argument('--run', nargs=argparse.REMAINDER, metavar='COMMAND',
+                        help='Run a netperf command, passing its output through with the interim '
+                             'results replaced by a NETPERF_INTERIM_SUMMARY=<json> summary line')
     args = parser.parse_args()
     
+    if args.run:
+        sys.exit(run_and_summarize(args.run))
+    
+    if args.backend == 'numpy' and not HAS_NUMPY:
+        print("Error: --backend numpy requires numpy (pip install numpy)", file=sys.stderr)
+        sys.exit(1)
+    
+    if args.batch:
+        try:
+            rows = compare_series_dirs(args.batch[0], args.batch[1], test=args.test,
+                                       alpha=args.fdr, higher_is_better=not args.lower_is_better,
+                                       workers=args.workers)
+        except OSError as e:
+            print(f"Error: Could not read series: {e}", file=sys.stderr)
+            sys.exit(1)
+        
+        if args.output == '-':
+            print(json.dumps(rows, indent=2))
+            sys.exit(0)
+        if args.output:
+            if args.output.endswith('.csv'):
+                import csv
+                with open(args.output, 'w', newline='') as f:
+                    fieldnames = list(dict.fromkeys(key for row in rows for key in row))
+                    writer = csv.DictWriter(f, fieldnames=fieldnames or ['name'])
+                    writer.writeheader()
+                    writer.writerows(rows)
+            else:
+                with open(args.output, 'w') as f:
+                    json.dump(rows, f, indent=2)
+        
+        print_batch_table(rows, args.fdr)
+        sys.exit(0)
+    
+    if args.segments:
+        values = []
+        timestamps = []
+        try:
+            source = sys.stdin if args.file in (None, '-') else open(args.file, 'r')
+        except FileNotFoundError:
+            print(f"Error: File '{args.file}' not found", file=sys.stderr)
+            sys.exit(1)
+        with source:
+            for line in source:
+                sample = parse_interim_line(line)
+                if sample is not None:
+                    values.append(sample[0])
+                    timestamps.append(sample[1])
+        
+        if not values:
+            print("Error: No values provided", file=sys.stderr)
+            sys.exit(1)
+        
+        detector = ChangePointDetector(penalty=args.penalty, min_size=args.min_segment)
+        result = detector.segment(values, timestamps if None not in timestamps else None)
+        
+        if args.output:
+            if args.output == '-':
+                print(json.dumps(result, indent=2))
+                sys.exit(0)
+            with open(args.output, 'w') as f:
+                json.dump(result, f, indent=2)
+        
+        print(f"Netperf Change-Point Analysis\n")
+        print(f"Samples: {result['count']}, change points: {len(result['change_points'])}\n")
+        print(f"  {'Samples':<15} {'Mean':>12} {'Median':>12} {'Std Dev':>10} {'CV':>7}")
+        for seg in result['segments']:
+            span = f"{seg['start']}-{seg['end'] - 1}"
+            marker = '  <- steady state' if seg is result['steady_state'] else ''
+            print(f"  {span:<15} {seg['mean']:>12.2f} {seg['median']:>12.2f} {seg['stddev']:>10.2f} "
+                  f"{seg['coefficient_of_variation']:>6.2f}%{marker}")
+        sys.exit(0)
+    
+    if args.merge:
+        try:
+            summaries = []
+            for path in args.merge:
+                with open(path, 'r') as f:
+                    summaries.append(json.load(f))
+            merged = StreamingStatistics.merged(summaries)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Error: Could not merge summaries: {e}", file=sys.stderr)
+            sys.exit(1)
+        
+        if args.summary_json:
+            if args.summary_json == '-':
+                print(json.dumps(merged.to_dict()))
+                sys.exit(0)
+            with open(args.summary_json, 'w') as f:
+                json.dump(merged.to_dict(), f)
+        
+        print(f"Netperf Statistics Analysis ({len(summaries)} merged summaries)\n")
+        print_stream_summary(merged.summary(args.confidence), args.confidence)
+        sys.exit(0)
+    
+    if args.stream:
+        # Constant memory: values are folded into the accumulator in chunks
+        stream_stats = StreamingStatistics()
+        next_report = args.report_every
+        chunk = []
+        try:
+            source = sys.stdin if args.file in (None, '-') else open(args.file, 'r')
+        except FileNotFoundError:
+            print(f"Error: File '{args.file}' not found", file=sys.stderr)
+            sys.exit(1)
+        
+        try:
+            for line in source:
+                value = parse_sample_line(line)
+                if value is None:
+                    continue
+                chunk.append(value)
+                if len(chunk) >= 4096 or (next_report and stream_stats.count + len(chunk) >= next_report):
+                    stream_stats.update(chunk)
+                    chunk.clear()
+                    if args.report_every > 0 and stream_stats.count >= next_report:
+                        print_stream_summary(stream_stats.summary(args.confidence), args.confidence)
+                        print(flush=True)
+                        next_report += args.report_every
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if source is not sys.stdin:
+                source.close()
+        stream_stats.update(chunk)
+        
+        if stream_stats.count == 0:
+            print("Error: No values provided", file=sys.stderr)
+            sys.exit(1)
+        
+        if args.summary_json:
+            if args.summary_json == '-':
+                print(json.dumps(stream_stats.to_dict()))
+                sys.exit(0)
+            with open(args.summary_json, 'w') as f:
+                json.dump(stream_stats.to_dict(), f)
+        
+        print(f"Netperf Statistics Analysis\n")
+        print_stream_summary(stream_stats.summary(args.confidence), args.confidence)
+        sys.exit(0)
+    
     # Read values
     values = []
     if args.file == '-' or args.file is None:
         # Read from stdin
         for line in sys.stdin:
-            line = line.strip()
-            if line:
-                try:
-                    values.append(float(line))
-                except ValueError:
-                    continue
+            value = parse_sample_line(line)
+            if value is not None:
+                values.append(value)
     else:
         # Read from file
         try:
             with open(args.file, 'r') as f:
                 for line in f:
-                    line = line.strip()
-                    if line:
-                        try:
-                            values.append(float(line))
-                        except ValueError:
-                            continue
+                    value = parse_sample_line(line)
+                    if value is not None:
+                        values.append(value)
         except FileNotFoundError:
             print(f"Error: File '{args.file}' not found", file=sys.stderr)
             sys.exit(1)
@@ -923,11 +2846,18 @@ if __name__ == "__main__":
         values,
         confidence_level=args.confidence,
         detect_outliers=not args.no_outliers,
-        outlier_method=args.outlier_method
+        outlier_method=args.outlier_method,
+        backend=args.backend,
+        ci_method=args.ci_method,
+        bootstrap=BootstrapEngine(args.bootstrap_samples, workers=args.workers)
     )
     
     print("Statistics:")
-    print(f"  Mean: {stats['mean']:.2f} ± {stats['ci_margin']:.2f} ({int(args.confidence*100)}% CI)")
+    ci_method = stats['ci_method']
+    if 'bootstrap_resamples' in stats:
+        ci_method += f", {stats['bootstrap_resamples']} resamples"
+    print(f"  Mean: {stats['mean']:.2f} ± {stats['ci_margin']:.2f} "
+          f"({int(args.confidence*100)}% CI, {ci_method})")
     print(f"  Median: {stats['median']:.2f}")
     print(f"  Std Dev: {stats['stddev']:.2f}")
     print(f"  CV: {stats['coefficient_of_variation']:.2f}%")
@@ -943,7 +2873,7 @@ if __name__ == "__main__":
         print(f"  Normal: N/A (sample size too small)")
     
     if not args.no_hist:
-        print("\n" + AdvancedStatistics.generate_histogram(values, bins=args.bins))
+        print("\n" + AdvancedStatistics.generate_histogram(values, bins=args.bins, backend=args.backend))
     
     if not args.no_boxplot:
         print("\n" + AdvancedStatistics.generate_boxplot(values))